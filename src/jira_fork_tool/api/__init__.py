@@ -7,20 +7,55 @@ including all operations needed for project forking and synchronization.
 
 import logging
 import time
-from typing import Dict, List, Any, Optional, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, Iterable, List, Any, Optional, Iterator, Union
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from ..config import JiraInstanceConfig
+from ..utils import TokenBucket
+
+# orjson is an optional, faster drop-in for payload (de)serialization
+try:
+    from orjson import loads as _loads, dumps as _dumps
+except ImportError:
+    from json import loads as _loads, dumps as _dumps
+
+# requests-toolbelt lets file uploads stream from disk instead of being
+# assembled in memory
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
 
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Issue fields consumed by the sync engine; requesting only these keeps search
+# pages small enough to fetch in large batches
+ISSUE_SYNC_FIELDS = 'summary,issuetype,status,updated,description,attachment,comment'
+
+# Connection pool sizing; the issue, page and link worker pools all share one
+# session per instance, so keep enough idle connections for all of them
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+# Most issues the Agile API accepts in a single move-to-epic request
+EPIC_LINK_BATCH_SIZE = 50
+
 
 class APIError(Exception):
     """Raised when Jira API operations fail."""
-    pass
+    
+    def __init__(self, message: str, status_code: Optional[int] = None,
+                 retry_after: Optional[int] = None):
+        """Initialize the error with the HTTP status and Retry-After, if known."""
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
 
 
 class RateLimitError(APIError):
@@ -36,6 +71,10 @@ class JiraAPI:
         self.config = config
         self.session = session
         self.base_url = f"{config.url}/rest/api/3"
+        self.agile_url = f"{config.url}/rest/agile/1.0"
+        self._epic_link_field: Optional[str] = None
+        # Optional shared limiter told to back off when the server returns 429
+        self.rate_limiter: Optional[TokenBucket] = None
         
         # Configure retry strategy
         retry_strategy = Retry(
@@ -43,16 +82,21 @@ class JiraAPI:
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=retry_strategy
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        self.session.headers['Connection'] = 'keep-alive'
     
     def get_project(self, project_key: str) -> Dict[str, Any]:
         """Get project information."""
         try:
             response = self.session.get(f"{self.base_url}/project/{project_key}")
             self._handle_response(response)
-            return response.json()
+            return _loads(response.content)
         except Exception as e:
             raise APIError(f"Failed to get project {project_key}: {e}")
     
@@ -69,7 +113,7 @@ class JiraAPI:
                 'fields': 'issuetype'
             })
             self._handle_response(response)
-            data = response.json()
+            data = _loads(response.content)
             
             total = data['total']
             
@@ -77,7 +121,7 @@ class JiraAPI:
             by_type = {}
             issue_types_response = self.session.get(f"{self.base_url}/project/{project_key}/statuses")
             if issue_types_response.ok:
-                issue_types = issue_types_response.json()
+                issue_types = _loads(issue_types_response.content)
                 for issue_type in issue_types:
                     type_jql = f"project = {project_key} AND issuetype = '{issue_type['name']}'"
                     type_response = self.session.get(search_url, params={
@@ -85,7 +129,7 @@ class JiraAPI:
                         'maxResults': 0
                     })
                     if type_response.ok:
-                        by_type[issue_type['name']] = type_response.json()['total']
+                        by_type[issue_type['name']] = _loads(type_response.content)['total']
             
             return {
                 'total': total,
@@ -95,87 +139,242 @@ class JiraAPI:
         except Exception as e:
             raise APIError(f"Failed to get issue statistics: {e}")
     
-    def get_all_issue_keys(self, project_key: str) -> List[str]:
+    def get_all_issue_keys(self, project_key: str, page_size: int = 1000) -> List[str]:
         """Get all issue keys in a project."""
         try:
             all_keys = []
             start_at = 0
-            max_results = 1000
             
             while True:
                 response = self.session.get(f"{self.base_url}/search", params={
                     'jql': f"project = {project_key} ORDER BY key ASC",
                     'startAt': start_at,
-                    'maxResults': max_results,
+                    'maxResults': page_size,
                     'fields': 'key'
                 })
                 self._handle_response(response)
-                data = response.json()
+                data = _loads(response.content)
                 
                 keys = [issue['key'] for issue in data['issues']]
                 all_keys.extend(keys)
                 
-                if len(keys) < max_results:
+                # The server may cap maxResults below page_size, so advance
+                # by what was actually returned
+                start_at += len(keys)
+                if not keys or start_at >= data['total']:
                     break
-                
-                start_at += max_results
             
             return all_keys
             
         except Exception as e:
             raise APIError(f"Failed to get issue keys: {e}")
     
-    def get_issues_in_order(self, project_key: str) -> List[Dict[str, Any]]:
+    def get_issues_in_order(self, project_key: str, page_size: int = 500,
+                            fields: str = ISSUE_SYNC_FIELDS) -> List[Dict[str, Any]]:
         """Get all issues in a project in key order."""
+        return list(self.iter_issues_in_order(project_key, page_size=page_size, fields=fields))
+    
+    def iter_issues_in_order(self, project_key: str, start_key: Optional[str] = None,
+                             page_size: int = 500,
+                             fields: str = ISSUE_SYNC_FIELDS) -> Iterator[Dict[str, Any]]:
+        """Yield the issues of a project in key order, one search page at a time.
+        
+        Args:
+            project_key: Project to read issues from
+            start_key: Optional issue key to start from (inclusive)
+            page_size: Number of issues requested per search page
+            fields: Comma-separated issue fields to fetch
+        """
+        jql = f"project = {project_key}"
+        if start_key:
+            jql += f" AND key >= {start_key}"
+        
         try:
-            all_issues = []
             start_at = 0
-            max_results = 100
             
             while True:
                 response = self.session.get(f"{self.base_url}/search", params={
-                    'jql': f"project = {project_key} ORDER BY key ASC",
+                    'jql': f"{jql} ORDER BY key ASC",
                     'startAt': start_at,
-                    'maxResults': max_results,
-                    'expand': 'changelog,attachments,comments'
+                    'maxResults': page_size,
+                    'fields': fields
                 })
                 self._handle_response(response)
-                data = response.json()
+                data = _loads(response.content)
                 
-                all_issues.extend(data['issues'])
+                yield from data['issues']
                 
-                if len(data['issues']) < max_results:
+                start_at += len(data['issues'])
+                if not data['issues'] or start_at >= data['total']:
                     break
                 
-                start_at += max_results
-                
                 # Rate limiting
                 time.sleep(0.1)
             
+        except APIError:
+            raise
+        except Exception as e:
+            raise APIError(f"Failed to get issues: {e}")
+    
+    def search_issues_parallel(self, jql: str, fields: Optional[str] = None,
+                               concurrency: int = 8, batch_size: int = 100) -> List[Dict[str, Any]]:
+        """Run a JQL search, fetching all pages after the first concurrently.
+        
+        Args:
+            jql: JQL query; include an ORDER BY clause for a stable page order
+            fields: Optional comma-separated issue fields to fetch
+            concurrency: Maximum number of pages fetched at once
+            batch_size: Number of issues requested per page (``maxResults``)
+            
+        Returns:
+            Matching issues in result order
+        """
+        def fetch_page(start_at: int) -> Dict[str, Any]:
+            params = {'jql': jql, 'startAt': start_at, 'maxResults': batch_size}
+            if fields:
+                params['fields'] = fields
+            response = self.session.get(f"{self.base_url}/search", params=params)
+            self._handle_response(response)
+            return _loads(response.content)
+        
+        try:
+            # The first page also tells us the total to plan the other windows
+            first_page = fetch_page(0)
+            issues = first_page['issues']
+            total = first_page['total']
+            if not issues or len(issues) >= total:
+                return issues
+            
+            # The server may cap maxResults, so size windows by the real page
+            page = len(issues)
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for data in executor.map(fetch_page, range(page, total, page)):
+                    issues.extend(data['issues'])
+            
+            return issues
+            
+        except APIError:
+            raise
+        except Exception as e:
+            raise APIError(f"Failed to search issues: {e}")
+    
+    def get_issues_by_keys(self, issue_keys: List[str], fields: str = 'summary') -> List[Dict[str, Any]]:
+        """Get a set of issues by key, fetching only the requested fields."""
+        try:
+            all_issues = []
+            chunk_size = 100
+            
+            for i in range(0, len(issue_keys), chunk_size):
+                chunk = issue_keys[i:i + chunk_size]
+                response = self.session.get(f"{self.base_url}/search", params={
+                    'jql': f"key in ({', '.join(chunk)})",
+                    'maxResults': len(chunk),
+                    'fields': fields
+                })
+                self._handle_response(response)
+                all_issues.extend(_loads(response.content)['issues'])
+            
             return all_issues
             
         except Exception as e:
-            raise APIError(f"Failed to get issues: {e}")
+            raise APIError(f"Failed to get issues by key: {e}")
     
     def create_issue(self, issue_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new issue."""
         try:
             response = self.session.post(
                 f"{self.base_url}/issue",
-                json=issue_data
+                data=_dumps(issue_data),
+                headers=_JSON_HEADERS
             )
             self._handle_response(response)
-            return response.json()
+            return _loads(response.content)
             
+        except APIError as e:
+            raise APIError(f"Failed to create issue: {e}", e.status_code, e.retry_after)
         except Exception as e:
             raise APIError(f"Failed to create issue: {e}")
     
+    def download_attachment(self, attachment_id: str) -> bytes:
+        """Download the content of an attachment."""
+        try:
+            response = self.session.get(f"{self.base_url}/attachment/content/{attachment_id}")
+            self._handle_response(response)
+            return response.content
+            
+        except Exception as e:
+            raise APIError(f"Failed to download attachment {attachment_id}: {e}")
+    
+    def download_attachment_stream(self, attachment_id: str,
+                                   chunk_size: int = 1 << 20) -> Iterator[bytes]:
+        """Yield the content of an attachment in chunks without buffering it whole."""
+        try:
+            response = self.session.get(
+                f"{self.base_url}/attachment/content/{attachment_id}",
+                stream=True
+            )
+            self._handle_response(response)
+        except Exception as e:
+            raise APIError(f"Failed to download attachment {attachment_id}: {e}")
+        
+        with response:
+            try:
+                yield from response.iter_content(chunk_size=chunk_size)
+            except Exception as e:
+                raise APIError(f"Failed to download attachment {attachment_id}: {e}")
+    
+    def add_attachment(self, issue_key: str, filename: str,
+                       content: Union[bytes, BinaryIO]) -> List[Dict[str, Any]]:
+        """Upload an attachment to an issue.
+        
+        Args:
+            issue_key: Issue to attach the file to
+            filename: Name of the attachment
+            content: Attachment bytes, or a binary file object to stream from
+        """
+        # Drop the session's JSON content type so the multipart boundary is used
+        headers = {'X-Atlassian-Token': 'no-check', 'Content-Type': None}
+        try:
+            if MultipartEncoder is not None and not isinstance(content, bytes):
+                encoder = MultipartEncoder(fields={'file': (filename, content)})
+                headers['Content-Type'] = encoder.content_type
+                response = self.session.post(
+                    f"{self.base_url}/issue/{issue_key}/attachments",
+                    data=encoder,
+                    headers=headers
+                )
+            else:
+                response = self.session.post(
+                    f"{self.base_url}/issue/{issue_key}/attachments",
+                    files={'file': (filename, content)},
+                    headers=headers
+                )
+            self._handle_response(response)
+            return _loads(response.content)
+            
+        except Exception as e:
+            raise APIError(f"Failed to add attachment {filename} to {issue_key}: {e}")
+    
+    def add_comment(self, issue_key: str, comment_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a comment to an issue."""
+        try:
+            response = self.session.post(
+                f"{self.base_url}/issue/{issue_key}/comment",
+                data=_dumps(comment_data),
+                headers=_JSON_HEADERS
+            )
+            self._handle_response(response)
+            return _loads(response.content)
+            
+        except Exception as e:
+            raise APIError(f"Failed to add comment to {issue_key}: {e}")
+    
     def get_custom_fields(self, project_key: str) -> List[Dict[str, Any]]:
         """Get custom fields used in a project."""
         try:
             response = self.session.get(f"{self.base_url}/field")
             self._handle_response(response)
-            all_fields = response.json()
+            all_fields = _loads(response.content)
             
             # Filter to custom fields
             custom_fields = [f for f in all_fields if f['custom']]
@@ -220,7 +419,7 @@ class JiraAPI:
             issue_types = []
             seen_ids = set()
             
-            for item in response.json():
+            for item in _loads(response.content):
                 issue_type = {
                     'id': item.get('id'),
                     'name': item.get('name'),
@@ -240,7 +439,7 @@ class JiraAPI:
                 )
                 self._handle_response(response)
                 
-                data = response.json()
+                data = _loads(response.content)
                 if 'projects' in data and data['projects']:
                     project = data['projects'][0]
                     if 'issuetypes' in project:
@@ -267,7 +466,7 @@ class JiraAPI:
             statuses = []
             seen_ids = set()
             
-            for item in response.json():
+            for item in _loads(response.content):
                 for status in item.get('statuses', []):
                     status_id = status.get('id')
                     if status_id not in seen_ids:
@@ -293,25 +492,49 @@ class JiraAPI:
             response = self.session.get(f"{self.base_url}/user/assignable/search", 
                                        params={'project': project_key})
             self._handle_response(response)
-            return response.json()
+            return _loads(response.content)
             
         except Exception as e:
             logger.error(f"Failed to get project users: {e}")
             return []
     
-    def get_issue_count(self, project_key: str) -> int:
-        """Get the total number of issues in a project."""
+    def get_issue_count(self, project_key: str, before_key: Optional[str] = None) -> int:
+        """Get the total number of issues in a project, optionally only those before a key."""
+        jql = f"project = {project_key}"
+        if before_key:
+            jql += f" AND key < {before_key}"
+        
         try:
             response = self.session.get(f"{self.base_url}/search", params={
-                'jql': f"project = {project_key}",
+                'jql': jql,
                 'maxResults': 0
             })
             self._handle_response(response)
-            return response.json()['total']
+            return _loads(response.content)['total']
             
         except Exception as e:
             raise APIError(f"Failed to get issue count: {e}")
     
+    def get_latest_update(self, project_key: str) -> Dict[str, Any]:
+        """Get the most recent update time and the issue count of a project."""
+        try:
+            response = self.session.get(f"{self.base_url}/search", params={
+                'jql': f"project = {project_key} ORDER BY updated DESC",
+                'maxResults': 1,
+                'fields': 'updated'
+            })
+            self._handle_response(response)
+            data = _loads(response.content)
+            
+            issues = data['issues']
+            return {
+                'updated': issues[0]['fields']['updated'] if issues else None,
+                'total': data['total']
+            }
+            
+        except Exception as e:
+            raise APIError(f"Failed to get latest update: {e}")
+    
     def get_updated_issues(self, project_key: str, since: Any) -> List[Dict[str, Any]]:
         """Get issues updated since a specific time."""
         try:
@@ -321,12 +544,9 @@ class JiraAPI:
             else:
                 since_str = str(since)
             
-            response = self.session.get(f"{self.base_url}/search", params={
-                'jql': f"project = {project_key} AND updated >= '{since_str}'",
-                'maxResults': 1000
-            })
-            self._handle_response(response)
-            return response.json()['issues']
+            return self.search_issues_parallel(
+                f"project = {project_key} AND updated >= '{since_str}' ORDER BY key ASC"
+            )
             
         except Exception as e:
             raise APIError(f"Failed to get updated issues: {e}")
@@ -348,29 +568,21 @@ class JiraAPI:
             
             response = self.session.post(
                 f"{self.base_url}/issueLink",
-                json=link_data
+                data=_dumps(link_data),
+                headers=_JSON_HEADERS
             )
             self._handle_response(response)
             return {'success': True}
             
+        except APIError as e:
+            raise APIError(f"Failed to create issue link: {e}", e.status_code, e.retry_after)
         except Exception as e:
             raise APIError(f"Failed to create issue link: {e}")
     
     def create_epic_link(self, epic_key: str, issue_key: str) -> Dict[str, Any]:
         """Create an epic link between an epic and an issue."""
         try:
-            # First, try to find the epic link field
-            fields_response = self.session.get(f"{self.base_url}/field")
-            self._handle_response(fields_response)
-            
-            epic_link_field = None
-            for field in fields_response.json():
-                if field.get('name') == 'Epic Link' or 'epic' in field.get('name', '').lower():
-                    epic_link_field = field['id']
-                    break
-            
-            if not epic_link_field:
-                raise APIError("Epic Link field not found")
+            epic_link_field = self._get_epic_link_field()
             
             # Update the issue with the epic link
             update_data = {
@@ -381,87 +593,144 @@ class JiraAPI:
             
             response = self.session.put(
                 f"{self.base_url}/issue/{issue_key}",
-                json=update_data
+                data=_dumps(update_data),
+                headers=_JSON_HEADERS
             )
             self._handle_response(response)
             return {'success': True}
             
+        except APIError as e:
+            raise APIError(f"Failed to create epic link: {e}", e.status_code, e.retry_after)
         except Exception as e:
             raise APIError(f"Failed to create epic link: {e}")
     
-    def get_all_issue_links(self, issue_keys: List[str]) -> List[Dict[str, Any]]:
-        """Get all issue links for a list of issues."""
+    def _get_epic_link_field(self) -> str:
+        """Get the ID of the Epic Link custom field, looking it up only once."""
+        if self._epic_link_field is None:
+            fields_response = self.session.get(f"{self.base_url}/field")
+            self._handle_response(fields_response)
+            
+            for field in _loads(fields_response.content):
+                if field.get('name') == 'Epic Link' or 'epic' in field.get('name', '').lower():
+                    self._epic_link_field = field['id']
+                    break
+            
+            if not self._epic_link_field:
+                raise APIError("Epic Link field not found")
+        
+        return self._epic_link_field
+    
+    def create_epic_links_bulk(self, epic_key: str, issue_keys: List[str]) -> Dict[str, Any]:
+        """Move several issues into an epic with one request per batch.
+        
+        Args:
+            epic_key: Key of the epic
+            issue_keys: Keys of the issues to add, at most EPIC_LINK_BATCH_SIZE
+            
+        Returns:
+            Success marker, as for create_epic_link
+        """
         try:
+            response = self.session.post(
+                f"{self.agile_url}/epic/{epic_key}/issue",
+                data=_dumps({'issues': issue_keys}),
+                headers=_JSON_HEADERS
+            )
+            self._handle_response(response)
+            return {'success': True}
+            
+        except APIError as e:
+            raise APIError(f"Failed to add {len(issue_keys)} issues to epic {epic_key}: {e}",
+                           e.status_code, e.retry_after)
+        except Exception as e:
+            raise APIError(f"Failed to add {len(issue_keys)} issues to epic {epic_key}: {e}")
+    
+    def get_all_issue_links(self, issue_keys: Iterable[str], chunk_size: int = 100,
+                            concurrency: int = 8) -> List[Dict[str, Any]]:
+        """Get all issue links for a set of issues.
+        
+        Keys are looked up ``chunk_size`` at a time with ``key in (...)``
+        searches, run concurrently, instead of one request per issue. A chunk
+        whose search fails is logged and skipped, keeping the other chunks' links.
+        """
+        def fetch_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
+            try:
+                response = self.session.get(f"{self.base_url}/search", params={
+                    'jql': f"key in ({', '.join(chunk)})",
+                    'maxResults': len(chunk),
+                    'fields': 'issuelinks',
+                    # Skip keys that no longer exist instead of failing the query
+                    'validateQuery': 'warn'
+                })
+                self._handle_response(response)
+            except (APIError, requests.RequestException) as e:
+                logger.warning("Skipping issue links for %s: %s", ', '.join(chunk), e)
+                return []
+            return _loads(response.content)['issues']
+        
+        try:
+            keys = list(issue_keys)
+            chunks = [keys[i:i + chunk_size] for i in range(0, len(keys), chunk_size)]
             all_links = []
             
-            for key in issue_keys:
-                response = self.session.get(f"{self.base_url}/issue/{key}?fields=issuelinks")
-                if not response.ok:
-                    continue
-                
-                issue_data = response.json()
-                links = issue_data.get('fields', {}).get('issuelinks', [])
-                
-                for link in links:
-                    if 'inwardIssue' in link:
-                        all_links.append({
-                            'source_issue': key,
-                            'target_issue': link['inwardIssue']['key'],
-                            'link_type': link['type']['inward']
-                        })
-                    elif 'outwardIssue' in link:
-                        all_links.append({
-                            'source_issue': key,
-                            'target_issue': link['outwardIssue']['key'],
-                            'link_type': link['type']['outward']
-                        })
-                
-                # Rate limiting
-                time.sleep(0.1)
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for issues in executor.map(fetch_chunk, chunks):
+                    for issue_data in issues:
+                        key = issue_data['key']
+                        links = issue_data.get('fields', {}).get('issuelinks', [])
+                        
+                        for link in links:
+                            if 'inwardIssue' in link:
+                                all_links.append({
+                                    'source_issue': key,
+                                    'target_issue': link['inwardIssue']['key'],
+                                    'link_type': link['type']['inward']
+                                })
+                            elif 'outwardIssue' in link:
+                                all_links.append({
+                                    'source_issue': key,
+                                    'target_issue': link['outwardIssue']['key'],
+                                    'link_type': link['type']['outward']
+                                })
             
             return all_links
             
         except Exception as e:
             raise APIError(f"Failed to get issue links: {e}")
     
-    def get_all_epic_links(self, issue_keys: List[str]) -> List[Dict[str, Any]]:
-        """Get all epic links for a list of issues."""
+    def get_all_epic_links(self, issue_keys: Iterable[str]) -> List[Dict[str, Any]]:
+        """Get all epic links for a set of issues."""
         try:
-            all_epic_links = []
-            
-            # First, try to find the epic link field
-            fields_response = self.session.get(f"{self.base_url}/field")
-            self._handle_response(fields_response)
-            
-            epic_link_field = None
-            for field in fields_response.json():
-                if field.get('name') == 'Epic Link' or 'epic' in field.get('name', '').lower():
-                    epic_link_field = field['id']
-                    break
-            
-            if not epic_link_field:
+            try:
+                epic_link_field = self._get_epic_link_field()
+            except APIError:
                 logger.warning("Epic Link field not found")
                 return []
             
-            # Get epic links for each issue
-            for key in issue_keys:
-                response = self.session.get(
-                    f"{self.base_url}/issue/{key}?fields={epic_link_field}"
-                )
-                if not response.ok:
-                    continue
-                
-                issue_data = response.json()
-                epic_key = issue_data.get('fields', {}).get(epic_link_field)
-                
-                if epic_key:
-                    all_epic_links.append({
-                        'epic_key': epic_key,
-                        'issue_key': key
-                    })
-                
-                # Rate limiting
-                time.sleep(0.1)
+            # Search only the issues that have an epic, across their projects,
+            # instead of fetching every issue one by one
+            wanted = set(issue_keys)
+            projects = sorted({key.rsplit('-', 1)[0] for key in wanted})
+            if not projects:
+                return []
+            field_ref = (
+                f"cf[{epic_link_field[len('customfield_'):]}]"
+                if epic_link_field.startswith('customfield_')
+                else epic_link_field
+            )
+            issues = self.search_issues_parallel(
+                f"project in ({', '.join(projects)}) AND {field_ref} is not EMPTY ORDER BY key ASC",
+                fields=epic_link_field
+            )
+            
+            all_epic_links = [
+                {
+                    'epic_key': issue['fields'][epic_link_field],
+                    'issue_key': issue['key']
+                }
+                for issue in issues
+                if issue['key'] in wanted and issue.get('fields', {}).get(epic_link_field)
+            ]
             
             return all_epic_links
             
@@ -488,7 +757,7 @@ class JiraAPI:
                 if not response.ok:
                     continue
                 
-                issue_data = response.json()
+                issue_data = _loads(response.content)
                 
                 # Check if this issue has subtasks
                 subtasks = issue_data.get('fields', {}).get('subtasks', [])
@@ -536,7 +805,8 @@ class JiraAPI:
             
             response = self.session.put(
                 f"{self.base_url}/issue/{subtask_key}",
-                json=update_data
+                data=_dumps(update_data),
+                headers=_JSON_HEADERS
             )
             self._handle_response(response)
             return {'success': True}
@@ -554,7 +824,7 @@ class JiraAPI:
             response = self.session.get(f"{self.base_url}/issueLinkType")
             self._handle_response(response)
             
-            return response.json().get('issueLinkTypes', [])
+            return _loads(response.content).get('issueLinkTypes', [])
             
         except Exception as e:
             logger.error(f"Failed to get issue link types: {e}")
@@ -579,9 +849,20 @@ class JiraAPI:
         if response.status_code == 429:
             retry_after = int(response.headers.get('Retry-After', 60))
             logger.warning(f"Rate limit exceeded. Retry after {retry_after} seconds.")
+            if self.rate_limiter is not None:
+                self.rate_limiter.backoff(retry_after)
+            # Wait here so callers without a retry policy still back off;
+            # retrying callers can then try again straight away
             time.sleep(retry_after)
-            raise RateLimitError(f"Rate limit exceeded: {response.text}")
+            raise RateLimitError(
+                f"Rate limit exceeded: {response.text}",
+                status_code=429,
+                retry_after=retry_after
+            )
         
         if not response.ok:
             logger.error(f"API error: {response.status_code} - {response.text}")
-            raise APIError(f"API error: {response.status_code} - {response.text}")
+            raise APIError(
+                f"API error: {response.status_code} - {response.text}",
+                status_code=response.status_code
+            )
@@ -57,6 +57,12 @@ class AuthManager:
             "destination"
         )
     
+    def close(self) -> None:
+        """Close both sessions and their pooled connections."""
+        for session in (self.source_session, self.dest_session):
+            if session is not None:
+                session.close()
+    
     def _create_session(self, instance_config: JiraInstanceConfig, 
                        instance_name: str) -> requests.Session:
         """Create an authenticated session for a Jira instance."""
@@ -74,9 +74,15 @@ class SyncConfig:
     include_worklogs: bool = True
     include_links: bool = True
     batch_size: int = 100
+    concurrency: int = 4  # Issues processed in parallel
+    link_concurrency: int = 8  # Links created in parallel
+    attachment_concurrency: int = 8  # Attachments transferred in parallel per issue
     max_retries: int = 3
     retry_delay: int = 5
     rate_limit_buffer: float = 0.8  # Use 80% of rate limit
+    rate_limit_per_second: float = 10.0  # Jira API rate limit (issues/sec)
+    validation_sample_rate: float = 0.05  # Fraction of issues deep-checked after sync
+    analysis_cache_dir: Optional[str] = "~/.cache/jira_fork_tool/analysis"  # Set to None to disable
     
     # Field mapping configuration
     field_mappings: Dict[str, str] = field(default_factory=dict)
@@ -97,6 +103,7 @@ class DatabaseConfig:
     """Database configuration for state management."""
     type: str = "sqlite"  # "sqlite", "postgresql"
     path: Optional[str] = "data/jira_fork_tool.db"
+    read_pool_size: int = 4  # Read-only SQLite connections for concurrent readers
     host: Optional[str] = None
     port: Optional[int] = None
     database: Optional[str] = None
@@ -231,9 +238,16 @@ class Config:
             include_worklogs=data.get('include_worklogs', True),
             include_links=data.get('include_links', True),
             batch_size=data.get('batch_size', 100),
+            concurrency=data.get('concurrency', 4),
+            link_concurrency=data.get('link_concurrency', 8),
+            attachment_concurrency=data.get('attachment_concurrency', 8),
             max_retries=data.get('max_retries', 3),
             retry_delay=data.get('retry_delay', 5),
             rate_limit_buffer=data.get('rate_limit_buffer', 0.8),
+            rate_limit_per_second=data.get('rate_limit_per_second', 10.0),
+            validation_sample_rate=data.get('validation_sample_rate', 0.05),
+            analysis_cache_dir=data.get('analysis_cache_dir',
+                                       '~/.cache/jira_fork_tool/analysis'),
             field_mappings=data.get('field_mappings', {}),
             user_mappings=data.get('user_mappings', {}),
             gap_strategy=data.get('gap_strategy', 'placeholder'),
@@ -250,6 +264,7 @@ class Config:
         return DatabaseConfig(
             type=data.get('type', 'sqlite'),
             path=data.get('path', 'data/jira_fork_tool.db'),
+            read_pool_size=data.get('read_pool_size', 4),
             host=data.get('host'),
             port=data.get('port'),
             database=data.get('database'),
@@ -293,12 +308,30 @@ class Config:
         if self.sync.batch_size <= 0:
             errors.append("Batch size must be positive")
         
+        if self.sync.concurrency <= 0:
+            errors.append("Concurrency must be positive")
+        
+        if self.sync.link_concurrency <= 0:
+            errors.append("Link concurrency must be positive")
+        
+        if self.sync.attachment_concurrency <= 0:
+            errors.append("Attachment concurrency must be positive")
+        
+        if self.sync.rate_limit_per_second <= 0:
+            errors.append("Rate limit per second must be positive")
+        
         if self.sync.max_retries < 0:
             errors.append("Max retries cannot be negative")
         
         if not 0 < self.sync.rate_limit_buffer <= 1:
             errors.append("Rate limit buffer must be between 0 and 1")
         
+        if not 0 <= self.sync.validation_sample_rate <= 1:
+            errors.append("Validation sample rate must be between 0 and 1")
+        
+        if self.database.read_pool_size <= 0:
+            errors.append("Database read pool size must be positive")
+        
         # Validate gap strategy
         valid_gap_strategies = ['placeholder', 'skip', 'error']
         if self.sync.gap_strategy not in valid_gap_strategies:
@@ -348,9 +381,15 @@ class Config:
                 'include_worklogs': self.sync.include_worklogs,
                 'include_links': self.sync.include_links,
                 'batch_size': self.sync.batch_size,
+                'concurrency': self.sync.concurrency,
+                'link_concurrency': self.sync.link_concurrency,
+                'attachment_concurrency': self.sync.attachment_concurrency,
                 'max_retries': self.sync.max_retries,
                 'retry_delay': self.sync.retry_delay,
                 'rate_limit_buffer': self.sync.rate_limit_buffer,
+                'rate_limit_per_second': self.sync.rate_limit_per_second,
+                'validation_sample_rate': self.sync.validation_sample_rate,
+                'analysis_cache_dir': self.sync.analysis_cache_dir,
                 'field_mappings': self.sync.field_mappings,
                 'user_mappings': self.sync.user_mappings,
                 'gap_strategy': self.sync.gap_strategy,
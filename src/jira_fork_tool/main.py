@@ -140,6 +140,8 @@ Examples:
 
 def handle_fork_command(args, config: Config) -> int:
     """Handle the fork command."""
+    auth_manager = None
+    sync_engine = None
     try:
         # Initialize authentication
         auth_manager = AuthManager(config)
@@ -182,10 +184,18 @@ def handle_fork_command(args, config: Config) -> int:
         logging.exception("Unexpected error during fork operation")
         print(f"✗ Unexpected error: {e}")
         return 1
+    finally:
+        # Release pooled connections and the state database once the run is over
+        if sync_engine is not None:
+            sync_engine.close()
+        if auth_manager is not None:
+            auth_manager.close()
 
 
 def handle_sync_command(args, config: Config) -> int:
     """Handle the sync command."""
+    auth_manager = None
+    sync_engine = None
     try:
         # Initialize authentication
         auth_manager = AuthManager(config)
@@ -218,10 +228,18 @@ def handle_sync_command(args, config: Config) -> int:
         logging.exception("Unexpected error during sync operation")
         print(f"✗ Unexpected error: {e}")
         return 1
+    finally:
+        # Release pooled connections and the state database once the run is over
+        if sync_engine is not None:
+            sync_engine.close()
+        if auth_manager is not None:
+            auth_manager.close()
 
 
 def handle_resume_command(args, config: Config) -> int:
     """Handle the resume command."""
+    auth_manager = None
+    sync_engine = None
     try:
         # Initialize authentication
         auth_manager = AuthManager(config)
@@ -250,10 +268,17 @@ def handle_resume_command(args, config: Config) -> int:
         logging.exception("Unexpected error during resume operation")
         print(f"✗ Unexpected error: {e}")
         return 1
+    finally:
+        # Release pooled connections and the state database once the run is over
+        if sync_engine is not None:
+            sync_engine.close()
+        if auth_manager is not None:
+            auth_manager.close()
 
 
 def handle_dashboard_command(args, config: Config) -> int:
     """Handle the dashboard command."""
+    dashboard = None
     try:
         dashboard = Dashboard(config)
         print(f"Starting dashboard on http://{args.host}:{args.port}")
@@ -264,6 +289,9 @@ def handle_dashboard_command(args, config: Config) -> int:
         logging.exception("Error starting dashboard")
         print(f"✗ Dashboard error: {e}")
         return 1
+    finally:
+        if dashboard is not None:
+            dashboard.close()
 
 
 def handle_validate_command(args, config: Config) -> int:
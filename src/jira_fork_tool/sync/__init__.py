@@ -5,19 +5,28 @@ This module implements the main synchronization logic including sequential
 issue processing, gap detection, and comprehensive data transfer.
 """
 
+import hashlib
 import logging
+import math
+import random
+import re
+import secrets
+import tempfile
+import threading
 import time
-import uuid
 import json
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Iterator, Set
+from typing import Callable, Dict, FrozenSet, List, Optional, Any, Iterator, Set, Tuple
 from pathlib import Path
 
 from ..config import Config
 from ..auth import AuthManager
-from ..api import JiraAPI, APIError
-from ..utils import StateManager, ProgressTracker
+from ..api import EPIC_LINK_BATCH_SIZE, JiraAPI, APIError
+from ..utils import AnalysisCache, StateManager, ProgressTracker, TokenBucket
 from .content_handler import (
     truncate_summary, 
     format_description_for_cloud, 
@@ -32,16 +41,73 @@ from .link_mapper import (
     create_fallback_link
 )
 
+# orjson is an optional, faster serializer for payload debug logging
+try:
+    from orjson import dumps as _orjson_dumps
+except ImportError:
+    _orjson_dumps = None
+
 
 logger = logging.getLogger(__name__)
 
+# Fields compared between source payload and destination issue during validation;
+# these are the fields the issue payload writes (priority and labels are not copied)
+HASHED_FIELDS = ('summary', 'description', 'issuetype')
+
+# Custom field types that are known to be problematic during transfer
+PROBLEMATIC_FIELD_TYPES: FrozenSet[str] = frozenset({
+    "com.atlassian.jira.plugin.system.customfieldtypes:cascadingselect",
+    "com.pyxis.greenhopper.jira:gh-epic-link",
+    "com.atlassian.jira.plugin.system.customfieldtypes:multicheckboxes",
+    "com.atlassian.jira.plugin.system.customfieldtypes:multigrouppicker",
+    "com.atlassian.jira.plugin.system.customfieldtypes:multiselect",
+    "com.atlassian.jira.plugin.system.customfieldtypes:multiuserpicker",
+    "com.atlassian.jira.plugin.system.customfieldtypes:project",
+    "com.atlassian.jira.plugin.system.customfieldtypes:radiobuttons",
+    "com.atlassian.jira.plugin.system.customfieldtypes:select",
+    "com.atlassian.jira.plugin.system.customfieldtypes:textarea",
+    "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
+    "com.atlassian.jira.plugin.system.customfieldtypes:url",
+    "com.atlassian.jira.plugin.system.customfieldtypes:userpicker",
+    "com.atlassian.jira.plugin.system.customfieldtypes:version"
+})
+
+# Issue types mapped by name when there is no exact match, in priority order
+COMMON_ISSUE_TYPES = ('epic', 'story', 'task', 'sub-task', 'bug')
+
+# Status categories and the status name terms that map to them, in priority order
+STATUS_CATEGORIES = {
+    'to do': ['backlog', 'open', 'to do', 'todo', 'new', 'requirements', 'planning'],
+    'in progress': ['in progress', 'development', 'coding', 'review', 'testing', 'qa', 'verification'],
+    'done': ['done', 'closed', 'resolved', 'complete', 'finished', 'released', 'production']
+}
+
+# Inverted index from status term to category
+_STATUS_TERM_CATEGORY = {
+    term: category for category, terms in STATUS_CATEGORIES.items() for term in terms
+}
+
+_WORD_RE = re.compile(r"[\w-]+")
+
+# Trailing issue number of an issue key, e.g. "123" in "PROJ-123"
+_ISSUE_NUMBER_RE = re.compile(r"-(\d+)$")
+
+# Attachments larger than this (in bytes) are streamed instead of held in memory
+ATTACHMENT_STREAM_THRESHOLD = 8 * 1024 * 1024
+
+
+def _name_terms(name: str) -> Set[str]:
+    """Split a lowercase name into its words and adjacent word pairs."""
+    words = _WORD_RE.findall(name)
+    return set(words).union(f"{a} {b}" for a, b in zip(words, words[1:]))
+
 
 class SyncError(Exception):
     """Raised when synchronization operations fail."""
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class SyncResult:
     """Result of a synchronization operation."""
     success: bool
@@ -64,7 +130,7 @@ class SyncResult:
         return None
 
 
-@dataclass
+@dataclass(frozen=True)
 class IssueGap:
     """Represents a gap in issue numbering."""
     start_number: int
@@ -72,6 +138,116 @@ class IssueGap:
     reason: str = "deleted_or_missing"
 
 
+def _adf_text(node: Any) -> str:
+    """Collect the text of an ADF document, ignoring markup Jira may rewrite."""
+    if isinstance(node, dict):
+        if node.get('type') == 'text':
+            return node.get('text', '')
+        return ''.join(_adf_text(child) for child in node.get('content', ()))
+    if isinstance(node, list):
+        return ''.join(_adf_text(child) for child in node)
+    return node if isinstance(node, str) else ''
+
+
+def compute_content_hash(fields: Dict[str, Any]) -> str:
+    """Compute a stable hash over the validated subset of an issue's fields.
+    
+    Values are reduced to the form both the creation payload and a fetched
+    issue share: the issue type by id and the description by its text.
+    """
+    issue_type = fields.get('issuetype') or {}
+    canonical = json.dumps(
+        {
+            'summary': fields.get('summary'),
+            'description': _adf_text(fields.get('description')),
+            'issuetype': issue_type.get('id'),
+        },
+        sort_keys=True,
+        separators=(',', ':')
+    )
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _classify_jira_error(error: Exception, attempt: int) -> Optional[float]:
+    """Return how long to wait before retrying a failed call, or None to give up.
+    
+    Rate limits are retried at once, because JiraAPI has already waited for
+    the server's Retry-After. Server errors back off exponentially and any
+    other client error is permanent.
+    """
+    status_code = getattr(error, 'status_code', None)
+    if status_code == 429:
+        return 0
+    if status_code is not None and status_code >= 500:
+        return min(60, 2 ** attempt)
+    return None
+
+
+def make_payload_builder(dest_project: str) -> Callable[[Dict[str, Any], str], Dict[str, Any]]:
+    """Create a function that assembles issue creation payloads for one destination project.
+    
+    Everything fixed for the project is bound once, so each call only does
+    the per-issue work.
+    """
+    def build(issue: Dict[str, Any], issue_type_id: str) -> Dict[str, Any]:
+        source_fields = issue['fields']
+        fields = {
+            'project': {'key': dest_project},
+            'summary': truncate_summary(source_fields.get('summary', f"Issue from {issue['key']}")),
+            'issuetype': {'id': issue_type_id},
+        }
+        
+        # Add description if available; the content handler formats and
+        # truncates it if needed
+        if 'description' in source_fields:
+            fields['description'] = merge_descriptions(issue['key'], source_fields['description'])
+        
+        return {'fields': fields}
+    
+    return build
+
+
+def generate_sync_id() -> str:
+    """Generate a unique, chronologically sortable sync session ID."""
+    return f"{datetime.now():%Y%m%d%H%M%S}-{secrets.token_hex(4)}"
+
+
+class _CreationSequencer:
+    """Serializes issue creation across worker threads in source order.
+    
+    Jira assigns issue numbers in creation order, so when numbers must be
+    preserved only the ``create_issue`` call is ordered; the rest of the
+    per-issue work runs concurrently.
+    """
+    
+    def __init__(self, first_index: int):
+        """Initialize the sequencer starting at the given issue index."""
+        self._next_index = first_index
+        self._released: Set[int] = set()
+        self._condition = threading.Condition()
+    
+    @contextmanager
+    def turn(self, index: int) -> Iterator[None]:
+        """Wait until every earlier issue has been created or given up."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._next_index == index)
+        try:
+            yield
+        finally:
+            self.release(index)
+    
+    def release(self, index: int) -> None:
+        """Let later issues proceed past the given index."""
+        with self._condition:
+            if index < self._next_index:
+                return
+            self._released.add(index)
+            while self._next_index in self._released:
+                self._released.discard(self._next_index)
+                self._next_index += 1
+            self._condition.notify_all()
+
+
 class SyncEngine:
     """Core synchronization engine for Jira project forking."""
     
@@ -89,10 +265,74 @@ class SyncEngine:
         )
         self.state_manager = StateManager(config.database)
         self.progress_tracker = ProgressTracker()
+        self.analysis_cache = (
+            AnalysisCache(config.sync.analysis_cache_dir)
+            if config.sync.analysis_cache_dir else None
+        )
+        # Content hashes of issues created in the current run, not yet saved
+        self._content_hashes: Dict[str, str] = {}
+        self._metadata_cache: Dict[Tuple[Any, ...], Any] = {}
+        self._metadata_lock = threading.Lock()
+        self._user_mappings: Dict[Tuple[str, str], Dict[str, str]] = {}
+        self._sequencer: Optional[_CreationSequencer] = None
+        self._payload_builders: Dict[str, Callable[[Dict[str, Any], str], Dict[str, Any]]] = {}
+        self._rate_limiter = TokenBucket(
+            config.sync.rate_limit_per_second * config.sync.rate_limit_buffer,
+            burst=config.sync.concurrency
+        )
+        self.source_api.rate_limiter = self._rate_limiter
+        self.dest_api.rate_limiter = self._rate_limiter
+    
+    def close(self) -> None:
+        """Close the state database; the auth manager's sessions are left open."""
+        self.state_manager.close()
+        
+    def _cached(self, func: Callable[..., Any], *args: Any, key: Optional[Tuple[Any, ...]] = None) -> Any:
+        """Call a metadata lookup once per engine and reuse its result.
+        
+        Results are keyed on the function, the API client it is bound to and
+        its arguments (or an explicit ``key`` for unhashable arguments).
+        """
+        cache_key = (
+            getattr(func, '__qualname__', repr(func)),
+            id(getattr(func, '__self__', None)),
+            key if key is not None else tuple(id(a) if isinstance(a, JiraAPI) else a for a in args)
+        )
+        with self._metadata_lock:
+            if cache_key in self._metadata_cache:
+                return self._metadata_cache[cache_key]
+        
+        result = func(*args)
+        with self._metadata_lock:
+            self._metadata_cache[cache_key] = result
+        return result
+    
+    def _with_retry(self, fn: Callable[[], Any], attempts: Optional[int] = None,
+                    classify: Callable[[Exception, int], Optional[float]] = _classify_jira_error) -> Any:
+        """Call ``fn``, retrying transient API failures.
         
+        Args:
+            fn: Zero-argument callable to invoke
+            attempts: Maximum number of calls; defaults to ``max_retries + 1``
+            classify: Maps an error and attempt number to a delay, or None if
+                the error should not be retried
+        """
+        if attempts is None:
+            attempts = self.config.sync.max_retries + 1
+        
+        for attempt in range(1, attempts + 1):
+            try:
+                return fn()
+            except APIError as e:
+                delay = classify(e, attempt)
+                if delay is None or attempt == attempts:
+                    raise
+                logger.warning("Retrying in %ss after attempt %d/%d failed: %s", delay, attempt, attempts, e)
+                time.sleep(delay)
+    
     def fork_project(self, source_project: str, dest_project: str, start_from: Optional[str] = None) -> SyncResult:
         """Fork a complete Jira project from source to destination."""
-        sync_id = str(uuid.uuid4())
+        sync_id = generate_sync_id()
         start_time = datetime.now()
         
         logger.info(f"Starting project fork: {source_project} -> {dest_project}")
@@ -172,16 +412,20 @@ class SyncEngine:
                 end_time=datetime.now()
             )
     
-    def dry_run_fork(self, source_project: str, dest_project: str) -> SyncResult:
-        """Perform a dry run of project forking without making changes."""
-        sync_id = f"dry-run-{uuid.uuid4()}"
+    def dry_run_fork(self, source_project: str, dest_project: str, use_cache: bool = True) -> SyncResult:
+        """Perform a dry run of project forking without making changes.
+        
+        With ``use_cache`` a previously cached analysis of an unchanged source
+        project is reused instead of re-scanning it.
+        """
+        sync_id = f"dry-run-{generate_sync_id()}"
         start_time = datetime.now()
         
         logger.info(f"Starting dry run fork: {source_project} -> {dest_project}")
         
         try:
             # Analyze source project
-            project_analysis = self._analyze_source_project(source_project)
+            project_analysis = self._analyze_source_project(source_project, use_cache=use_cache)
             
             # Simulate processing
             estimated_issues = project_analysis['total_issues']
@@ -228,7 +472,7 @@ class SyncEngine:
     
     def incremental_sync(self) -> SyncResult:
         """Perform incremental synchronization of changes."""
-        sync_id = str(uuid.uuid4())
+        sync_id = generate_sync_id()
         start_time = datetime.now()
         
         logger.info("Starting incremental synchronization")
@@ -305,31 +549,56 @@ class SyncEngine:
                 end_time=datetime.now()
             )
     
-    def _analyze_source_project(self, project_key: str) -> Dict[str, Any]:
+    def _analyze_source_project(self, project_key: str, use_cache: bool = True) -> Dict[str, Any]:
         """Analyze the source project structure and content."""
         logger.info(f"Analyzing source project: {project_key}")
         
         try:
-            # Get project information
-            project_info = self.source_api.get_project(project_key)
-            
-            # Get issue statistics
-            issue_stats = self.source_api.get_issue_statistics(project_key)
-            
-            # Detect gaps in issue numbering
-            gaps = self._detect_issue_gaps(project_key)
-            
-            # Analyze custom fields
-            custom_fields = self.source_api.get_custom_fields(project_key)
+            # Reuse a cached analysis if the project has not changed since
+            cache_key = self._analysis_cache_key(project_key)
+            if cache_key and use_cache:
+                cached = self.analysis_cache.load(cache_key)
+                if cached is not None:
+                    logger.info(f"Using cached analysis for {project_key}")
+                    cached['gaps'] = [IssueGap(**gap) for gap in cached['gaps']]
+                    return cached
+            
+            # The analysis calls are independent, so issue them concurrently
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                # Get project information
+                project_future = executor.submit(self.source_api.get_project, project_key)
+                
+                # Get issue statistics
+                stats_future = executor.submit(self.source_api.get_issue_statistics, project_key)
+                
+                # Detect gaps in issue numbering
+                gaps_future = executor.submit(self._detect_issue_gaps, project_key)
+                
+                # Analyze custom fields
+                fields_future = executor.submit(self._cached, self.source_api.get_custom_fields, project_key)
+                
+                # Analyze attachments
+                attachments_future = executor.submit(
+                    self.source_api.get_attachment_statistics, project_key
+                )
+                
+                # Analyze comments
+                comments_future = executor.submit(
+                    self.source_api.get_comment_statistics, project_key
+                )
+                
+                project_info = project_future.result()
+                issue_stats = stats_future.result()
+                gaps = gaps_future.result()
+                custom_fields = fields_future.result()
+                attachment_stats = attachments_future.result()
+                comment_stats = comments_future.result()
             
             # Check for unsupported field types
-            unsupported_fields = self._check_unsupported_fields(custom_fields)
-            
-            # Analyze attachments
-            attachment_stats = self.source_api.get_attachment_statistics(project_key)
-            
-            # Analyze comments
-            comment_stats = self.source_api.get_comment_statistics(project_key)
+            unsupported_fields = self._cached(
+                self._check_unsupported_fields, custom_fields,
+                key=tuple(sorted(str(f.get('id')) for f in custom_fields))
+            )
             
             analysis = {
                 'project_info': project_info,
@@ -351,11 +620,30 @@ class SyncEngine:
             logger.info(f"  Attachments: {analysis['total_attachments']}")
             logger.info(f"  Comments: {analysis['total_comments']}")
             
+            if cache_key:
+                self.analysis_cache.save(
+                    cache_key,
+                    dict(analysis, gaps=[asdict(gap) for gap in gaps])
+                )
+            
             return analysis
             
         except APIError as e:
             raise SyncError(f"Failed to analyze source project: {e}")
     
+    def _analysis_cache_key(self, project_key: str) -> Optional[str]:
+        """Build the analysis cache key from the project's latest update and size."""
+        if self.analysis_cache is None:
+            return None
+        
+        try:
+            latest = self.source_api.get_latest_update(project_key)
+        except APIError as e:
+            logger.warning(f"Skipping analysis cache: {e}")
+            return None
+        
+        return f"{self.config.source.url}:{project_key}:{latest['updated']}:{latest['total']}"
+    
     def _setup_destination_project(self, project_key: str, analysis: Dict[str, Any]) -> None:
         """Set up the destination project based on source project analysis."""
         logger.info(f"Setting up destination project: {project_key}")
@@ -371,7 +659,7 @@ class SyncEngine:
             logger.info(f"Destination project found: {dest_project.get('name')}")
             
             # Get available issue types in destination
-            dest_issue_types = self.dest_api.get_issue_types_for_project(project_key)
+            dest_issue_types = self._cached(self.dest_api.get_issue_types_for_project, project_key)
             
             # Create issue type mapping
             issue_type_mapping = self._create_issue_type_mapping(
@@ -382,7 +670,7 @@ class SyncEngine:
             logger.info(f"Created issue type mapping for {len(issue_type_mapping)} types")
             
             # Get available statuses in destination
-            dest_statuses = self.dest_api.get_statuses_for_project(project_key)
+            dest_statuses = self._cached(self.dest_api.get_statuses_for_project, project_key)
             
             # Create status mapping
             status_mapping = self._create_status_mapping(
@@ -393,7 +681,7 @@ class SyncEngine:
             logger.info(f"Created status mapping for {len(status_mapping)} statuses")
             
             # Get available link types in destination
-            dest_link_types = get_available_link_types(self.dest_api)
+            dest_link_types = self._cached(get_available_link_types, self.dest_api)
             logger.info(f"Found {len(dest_link_types)} link types in destination")
             
             # Store mappings for later use
@@ -413,8 +701,15 @@ class SyncEngine:
         # Create name-to-id mapping for destination types
         dest_type_map = {t['name'].lower(): t['id'] for t in dest_types}
         
-        # Map common types directly
-        common_types = ['epic', 'story', 'task', 'sub-task', 'bug']
+        # Common types present in the destination, in priority order
+        common_type_ids = [
+            (common_type, dest_type_map[common_type])
+            for common_type in COMMON_ISSUE_TYPES
+            if common_type in dest_type_map
+        ]
+        
+        # Default to Task, or as a last resort the first available type
+        default_id = dest_type_map.get('task') or (dest_types[0]['id'] if dest_types else None)
         
         for source_type in source_types:
             source_type_lower = source_type.lower()
@@ -424,20 +719,19 @@ class SyncEngine:
                 mapping[source_type] = dest_type_map[source_type_lower]
                 continue
                 
-            # Try common type mapping
-            mapped = False
-            for common_type in common_types:
-                if common_type in source_type_lower and common_type in dest_type_map:
-                    mapping[source_type] = dest_type_map[common_type]
-                    mapped = True
-                    break
-            
-            # Default to Task if no mapping found
-            if not mapped and 'task' in dest_type_map:
-                mapping[source_type] = dest_type_map['task']
-            elif not mapped and dest_types:
-                # Last resort: use first available type
-                mapping[source_type] = dest_types[0]['id']
+            # Try common type mapping on the words of the type name, then on
+            # substrings for compound names such as "Bugfix"
+            terms = _name_terms(source_type_lower)
+            type_id = next(
+                (common_id for common_type, common_id in common_type_ids if common_type in terms),
+                None
+            ) or next(
+                (common_id for common_type, common_id in common_type_ids
+                 if common_type in source_type_lower),
+                default_id
+            )
+            if type_id is not None:
+                mapping[source_type] = type_id
         
         return mapping
     
@@ -448,13 +742,6 @@ class SyncEngine:
         # Create name-to-id mapping for destination statuses
         dest_status_map = {s['name'].lower(): s['id'] for s in dest_statuses}
         
-        # Map common statuses
-        status_categories = {
-            'to do': ['backlog', 'open', 'to do', 'todo', 'new', 'requirements', 'planning'],
-            'in progress': ['in progress', 'development', 'coding', 'review', 'testing', 'qa', 'verification'],
-            'done': ['done', 'closed', 'resolved', 'complete', 'finished', 'released', 'production']
-        }
-        
         for source_status in source_statuses:
             source_status_lower = source_status.lower()
             
@@ -463,16 +750,29 @@ class SyncEngine:
                 mapping[source_status] = dest_status_map[source_status_lower]
                 continue
             
-            # Try category mapping
-            mapped = False
-            for category, keywords in status_categories.items():
-                if any(keyword in source_status_lower for keyword in keywords) and category in dest_status_map:
-                    mapping[source_status] = dest_status_map[category]
-                    mapped = True
-                    break
+            # Try category mapping via the term index
+            categories = {
+                _STATUS_TERM_CATEGORY[term]
+                for term in _name_terms(source_status_lower)
+                if term in _STATUS_TERM_CATEGORY
+            }
+            category = next(
+                (c for c in STATUS_CATEGORIES if c in categories and c in dest_status_map),
+                None
+            )
+            if category is None:
+                # Inflected names such as "Completed" or "Code Reviewed" only
+                # contain a term as a substring
+                category = next(
+                    (c for c, terms in STATUS_CATEGORIES.items()
+                     if c in dest_status_map and any(t in source_status_lower for t in terms)),
+                    None
+                )
             
-            # Default to first status if no mapping found
-            if not mapped and dest_statuses:
+            if category is not None:
+                mapping[source_status] = dest_status_map[category]
+            elif dest_statuses:
+                # Default to first status if no mapping found
                 mapping[source_status] = dest_statuses[0]['id']
         
         return mapping
@@ -481,29 +781,37 @@ class SyncEngine:
         """Synchronize users between source and destination."""
         logger.info("Synchronizing users")
         
+        source_project = analysis['project_info']['key']
+        dest_project = self.config.destination.project_key
+        cache_key = (source_project, dest_project)
+        if cache_key in self._user_mappings:
+            logger.info("Reusing user mapping built earlier in this session")
+            return self._user_mappings[cache_key]
+        
         # Get user mapping from config
         user_mapping = self.config.sync.user_mappings.copy()
         
         # Get all users from source project
         try:
-            source_users = self.source_api.get_project_users(analysis['project_info']['key'])
+            source_users = self._cached(self.source_api.get_project_users, source_project)
             
             # Get destination users
-            dest_users = self.dest_api.get_project_users(self.config.destination.project_key)
-            dest_user_map = {u['emailAddress']: u['accountId'] for u in dest_users if 'emailAddress' in u}
+            dest_users = self._cached(self.dest_api.get_project_users, dest_project)
+            dest_emails = {u['emailAddress'] for u in dest_users if 'emailAddress' in u}
+            
+            # Unmatched users default to the destination account
+            default_email = self.config.destination.auth.email
             
             # Create mapping for users not already mapped
             for user in source_users:
                 email = user.get('emailAddress')
-                if email and email not in user_mapping:
-                    # Try to find matching user in destination
-                    if email in dest_user_map:
-                        user_mapping[email] = email  # Direct mapping
-                    else:
-                        # Default to project lead if no match
-                        user_mapping[email] = self.config.destination.auth.email
+                if not email or email in user_mapping:
+                    continue
+                # Direct mapping if the user exists in destination
+                user_mapping[email] = email if email in dest_emails else default_email
             
             logger.info(f"Created user mapping for {len(user_mapping)} users")
+            self._user_mappings[cache_key] = user_mapping
             return user_mapping
             
         except APIError as e:
@@ -514,31 +822,14 @@ class SyncEngine:
         """Check for custom fields that are not supported in the destination instance."""
         logger.info("Checking for unsupported custom fields")
         
-        # List of field types that are known to be problematic during transfer
-        problematic_types = [
-            "com.atlassian.jira.plugin.system.customfieldtypes:cascadingselect",
-            "com.pyxis.greenhopper.jira:gh-epic-link",
-            "com.atlassian.jira.plugin.system.customfieldtypes:multicheckboxes",
-            "com.atlassian.jira.plugin.system.customfieldtypes:multigrouppicker",
-            "com.atlassian.jira.plugin.system.customfieldtypes:multiselect",
-            "com.atlassian.jira.plugin.system.customfieldtypes:multiuserpicker",
-            "com.atlassian.jira.plugin.system.customfieldtypes:project",
-            "com.atlassian.jira.plugin.system.customfieldtypes:radiobuttons",
-            "com.atlassian.jira.plugin.system.customfieldtypes:select",
-            "com.atlassian.jira.plugin.system.customfieldtypes:textarea",
-            "com.atlassian.jira.plugin.system.customfieldtypes:textfield",
-            "com.atlassian.jira.plugin.system.customfieldtypes:url",
-            "com.atlassian.jira.plugin.system.customfieldtypes:userpicker",
-            "com.atlassian.jira.plugin.system.customfieldtypes:version"
-        ]
-        
         unsupported = []
         for field in custom_fields:
-            if field.get('schema', {}).get('custom') in problematic_types:
+            field_type = field.get('schema', {}).get('custom')
+            if field_type in PROBLEMATIC_FIELD_TYPES:
                 unsupported.append({
                     'id': field.get('id'),
                     'name': field.get('name'),
-                    'type': field.get('schema', {}).get('custom'),
+                    'type': field_type,
                     'reason': "Field type may not transfer correctly"
                 })
         
@@ -556,101 +847,136 @@ class SyncEngine:
             # Extract issue numbers
             issue_numbers = []
             for key in issue_keys:
-                try:
-                    number = int(key.split('-')[1])
-                    issue_numbers.append(number)
-                except (IndexError, ValueError):
-                    logger.warning(f"Could not parse issue number from key: {key}")
+                match = _ISSUE_NUMBER_RE.search(key)
+                if match:
+                    issue_numbers.append(int(match.group(1)))
+                else:
+                    logger.warning("Could not parse issue number from key: %s", key)
             
             if not issue_numbers:
                 return []
             
-            # Sort numbers and find gaps
+            # Dense numbering (the common case) has no gaps; keys are unique,
+            # so this holds exactly when the count spans the whole range
+            if max(issue_numbers) - min(issue_numbers) + 1 == len(issue_numbers):
+                logger.info("Found 0 gaps in issue numbering")
+                return []
+            
+            # Sort numbers and find gaps between neighbours
             issue_numbers.sort()
-            gaps = []
+            gaps = [
+                IssueGap(
+                    start_number=current + 1,
+                    end_number=next_num - 1,
+                    reason="deleted_or_missing"
+                )
+                for current, next_num in zip(issue_numbers, issue_numbers[1:])
+                if next_num - current > 1
+            ]
             
-            for i in range(len(issue_numbers) - 1):
-                current = issue_numbers[i]
-                next_num = issue_numbers[i + 1]
-                
-                if next_num - current > 1:
-                    gaps.append(IssueGap(
-                        start_number=current + 1,
-                        end_number=next_num - 1,
-                        reason="deleted_or_missing"
-                    ))
-            
-            logger.info(f"Found {len(gaps)} gaps in issue numbering")
+            logger.info("Found %d gaps in issue numbering", len(gaps))
             return gaps
             
         except APIError as e:
-            logger.error(f"Failed to detect issue gaps: {e}")
+            logger.error("Failed to detect issue gaps: %s", e)
             return []
     
+    def _save_pending_state(self, sync_id: str, pending_mappings: Dict[str, str]) -> None:
+        """Persist the mappings and content hashes recorded since the last save."""
+        if pending_mappings:
+            self.state_manager.save_issue_mapping(sync_id, pending_mappings)
+            pending_mappings.clear()
+        if self._content_hashes:
+            self.state_manager.save_content_hashes(sync_id, self._content_hashes)
+            self._content_hashes.clear()
+    
     def _process_issues_sequentially(self, sync_id: str, source_project: str,
                                    dest_project: str, analysis: Dict[str, Any],
                                    start_from: Optional[str] = None) -> Dict[str, Any]:
-        """Process issues in sequential order to maintain numbering."""
+        """Process issues concurrently while creating them in source order to maintain numbering."""
         logger.info("Starting sequential issue processing")
         
         issue_mapping = {}
+        # Mappings created since the last write, persisted at each checkpoint
+        pending_mappings: Dict[str, str] = {}
+        # Hashes left over from an earlier run belong to a different session
+        self._content_hashes.clear()
         issues_processed = 0
         attachments_transferred = 0
         comments_synchronized = 0
         
         try:
-            # Get all issues in order
-            issues = self.source_api.get_issues_in_order(source_project)
-            total_issues = len(issues)
-            
-            self.progress_tracker.start_phase("issue_processing", total_issues)
+            # Stream issues in order instead of downloading them all up front
+            issues = self.source_api.iter_issues_in_order(source_project, start_key=start_from)
+            total_issues = analysis.get('total_issues') or self.source_api.get_issue_count(source_project)
             
             # Determine starting point if specified
             start_index = 0
             if start_from:
-                for i, issue in enumerate(issues):
-                    if issue['key'] == start_from:
-                        start_index = i
-                        logger.info(f"Resuming from issue {start_from} (index {start_index})")
-                        break
+                start_index = self.source_api.get_issue_count(source_project, before_key=start_from)
+                logger.info("Resuming from issue %s (index %d)", start_from, start_index)
+            
+            self.progress_tracker.start_phase("issue_processing", total_issues)
             
-            for i, issue in enumerate(issues[start_index:], start=start_index):
+            concurrency = self.config.sync.concurrency
+            batch_size = self.config.sync.batch_size
+            in_flight = deque()
+            if self.config.sync.preserve_numbers:
+                self._sequencer = _CreationSequencer(start_index)
+            
+            def collect(index: int, issue: Dict[str, Any], future) -> None:
+                nonlocal issues_processed, attachments_transferred, comments_synchronized
                 try:
-                    # Create checkpoint
-                    if i % self.config.sync.batch_size == 0:
-                        self.state_manager.create_checkpoint(
-                            sync_id=sync_id,
-                            phase="issue_processing",
-                            progress=i,
-                            total=total_issues,
-                            data={'last_processed_issue': issue['key']}
-                        )
-                    
-                    # Process individual issue
-                    result = self._process_single_issue(
-                        issue, dest_project, analysis
-                    )
-                    
-                    # Update counters
-                    issues_processed += 1
-                    attachments_transferred += result['attachments_transferred']
-                    comments_synchronized += result['comments_synchronized']
-                    
-                    # Update mapping
-                    issue_mapping[issue['key']] = result['dest_key']
-                    
-                    # Update progress
-                    self.progress_tracker.update_progress(i + 1)
-                    
+                    result = future.result()
                 except Exception as e:
-                    logger.error(f"Failed to process issue {issue['key']}: {e}")
+                    logger.error("Failed to process issue %s: %s", issue['key'], e)
                     # Continue with next issue instead of failing the entire process
-                    
-                # Rate limiting
-                time.sleep(self.config.sync.rate_limit_buffer)
+                    return
+                
+                # Update counters
+                issues_processed += 1
+                attachments_transferred += result['attachments_transferred']
+                comments_synchronized += result['comments_synchronized']
+                
+                # Update mapping
+                issue_mapping[issue['key']] = result['dest_key']
+                pending_mappings[issue['key']] = result['dest_key']
+                
+                # Update progress
+                self.progress_tracker.update_progress(index + 1)
             
-            # Save the complete mapping
-            self.state_manager.save_issue_mapping(sync_id, issue_mapping)
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                try:
+                    for i, issue in enumerate(issues, start=start_index):
+                        # Create checkpoint once every earlier issue has finished
+                        if i % batch_size == 0:
+                            while in_flight:
+                                collect(*in_flight.popleft())
+                            self._save_pending_state(sync_id, pending_mappings)
+                            self.state_manager.checkpoint_async(
+                                sync_id=sync_id,
+                                phase="issue_processing",
+                                progress=i,
+                                total=total_issues,
+                                data={'last_processed_issue': issue['key']}
+                            )
+                        
+                        # Keep at most `concurrency` issues in flight
+                        if len(in_flight) >= concurrency:
+                            collect(*in_flight.popleft())
+                        
+                        # Rate limiting
+                        self._rate_limiter.acquire()
+                        
+                        future = executor.submit(
+                            self._process_issue_in_order, i, issue, dest_project, analysis
+                        )
+                        in_flight.append((i, issue, future))
+                finally:
+                    # Collect submitted issues even if the loop failed, so every
+                    # issue created in the destination gets its mapping saved
+                    while in_flight:
+                        collect(*in_flight.popleft())
             
             return {
                 'issue_mapping': issue_mapping,
@@ -661,6 +987,14 @@ class SyncEngine:
             
         except APIError as e:
             raise SyncError(f"Failed to process issues: {e}")
+        
+        finally:
+            # Also runs on failure: stop the reporter and keep the issues
+            # created so far mapped, so a resume does not create them again
+            self._sequencer = None
+            self.progress_tracker.complete_phase()
+            self.state_manager.flush_checkpoints()
+            self._save_pending_state(sync_id, pending_mappings)
     
     def _synchronize_relationships(self, sync_id: str, issue_mapping: Dict[str, str]) -> Dict[str, int]:
         """Synchronize issue relationships after all issues are created."""
@@ -671,89 +1005,132 @@ class SyncEngine:
         
         try:
             # Get all issue links
-            links = self.source_api.get_all_issue_links(list(issue_mapping.keys()))
-            logger.info(f"Found {len(links)} issue links to synchronize")
+            links = self.source_api.get_all_issue_links(issue_mapping.keys())
+            logger.info("Found %d issue links to synchronize", len(links))
             
             # Get all source link types
-            source_link_types = set()
-            for link in links:
-                source_link_types.add(link['link_type'])
+            source_link_types = {link['link_type'] for link in links}
             
             # Create link type mapping
             link_type_mapping = create_link_type_mapping(source_link_types, self.dest_link_types)
-            logger.info(f"Created mapping for {len(link_type_mapping)} link types")
+            logger.info("Created mapping for %d link types", len(link_type_mapping))
             
-            # Process links
-            for link in links:
-                try:
-                    source_issue = link['source_issue']
-                    target_issue = link['target_issue']
-                    link_type = link['link_type']
-                    
-                    if source_issue in issue_mapping and target_issue in issue_mapping:
-                        # Map link type
-                        mapped_link_type = link_type_mapping.get(link_type)
-                        
-                        if mapped_link_type:
-                            # Create link in destination
-                            self.dest_api.create_issue_link(
-                                issue_mapping[source_issue],
-                                issue_mapping[target_issue],
-                                mapped_link_type
-                            )
-                            links_created += 1
-                            logger.info(f"Created link '{mapped_link_type}': {issue_mapping[source_issue]} -> {issue_mapping[target_issue]}")
-                        else:
-                            # Try fallback link
-                            if create_fallback_link(
-                                self.dest_api,
-                                issue_mapping[source_issue],
-                                issue_mapping[target_issue],
-                                self.dest_link_types
-                            ):
-                                links_created += 1
-                            else:
-                                links_failed += 1
-                                logger.warning(f"Could not create link for {source_issue} -> {target_issue}, no suitable link type found")
-                except Exception as e:
-                    links_failed += 1
-                    logger.error(f"Failed to create link: {e}")
+            # Process links concurrently; each call is a separate round-trip
+            with ThreadPoolExecutor(max_workers=self.config.sync.link_concurrency) as executor:
+                outcomes = list(executor.map(
+                    lambda link: self._create_link(link, issue_mapping, link_type_mapping),
+                    links
+                ))
+            links_created += outcomes.count(True)
+            links_failed += outcomes.count(False)
             
             # Get all epic links
-            epics = self.source_api.get_all_epic_links(list(issue_mapping.keys()))
-            logger.info(f"Found {len(epics)} epic links to synchronize")
+            epics = self.source_api.get_all_epic_links(issue_mapping.keys())
+            logger.info("Found %d epic links to synchronize", len(epics))
             
-            # Process epic links
+            # Group epic links by destination epic so each batch is one request
+            epic_children: Dict[str, List[str]] = {}
             for epic_link in epics:
-                try:
-                    epic_key = epic_link['epic_key']
-                    issue_key = epic_link['issue_key']
-                    
-                    if epic_key in issue_mapping and issue_key in issue_mapping:
-                        # Create epic link in destination
-                        self.dest_api.create_epic_link(
-                            issue_mapping[epic_key],
-                            issue_mapping[issue_key]
-                        )
-                        links_created += 1
-                        logger.info(f"Created epic link: {issue_mapping[epic_key]} -> {issue_mapping[issue_key]}")
-                except Exception as e:
-                    links_failed += 1
-                    logger.error(f"Failed to create epic link: {e}")
+                epic_key = epic_link['epic_key']
+                issue_key = epic_link['issue_key']
+                if epic_key in issue_mapping and issue_key in issue_mapping:
+                    epic_children.setdefault(issue_mapping[epic_key], []).append(issue_mapping[issue_key])
             
-            logger.info(f"Relationship synchronization complete: {links_created} created, {links_failed} failed")
+            # Process epic links
+            for dest_epic, dest_issues in epic_children.items():
+                for i in range(0, len(dest_issues), EPIC_LINK_BATCH_SIZE):
+                    batch = dest_issues[i:i + EPIC_LINK_BATCH_SIZE]
+                    created = self._create_epic_link_batch(dest_epic, batch)
+                    links_created += created
+                    links_failed += len(batch) - created
+            
+            logger.info("Relationship synchronization complete: %d created, %d failed", links_created, links_failed)
             return {
                 'links_created': links_created,
                 'links_failed': links_failed
             }
                     
         except APIError as e:
-            logger.error(f"Failed to synchronize relationships: {e}")
+            logger.error("Failed to synchronize relationships: %s", e)
             return {
                 'links_created': links_created,
                 'links_failed': links_failed
             }
     
+    def _create_epic_link_batch(self, dest_epic: str, dest_issues: List[str]) -> int:
+        """Add a batch of destination issues to an epic, returning how many succeeded.
+        
+        If the batch request fails, each issue is linked individually so one bad
+        issue does not fail the whole batch.
+        """
+        try:
+            self._rate_limiter.acquire()
+            self.dest_api.create_epic_links_bulk(dest_epic, dest_issues)
+            logger.info("Created %d epic links to %s", len(dest_issues), dest_epic)
+            return len(dest_issues)
+        except APIError as e:
+            logger.warning("Batch epic link to %s failed, linking individually: %s", dest_epic, e)
+        
+        created = 0
+        for dest_issue in dest_issues:
+            try:
+                self._rate_limiter.acquire()
+                self.dest_api.create_epic_link(dest_epic, dest_issue)
+                created += 1
+                logger.info("Created epic link: %s -> %s", dest_epic, dest_issue)
+            except Exception as e:
+                logger.error("Failed to create epic link: %s", e)
+        return created
+    
+    def _create_link(self, link: Dict[str, str], issue_mapping: Dict[str, str],
+                     link_type_mapping: Dict[str, str]) -> Optional[bool]:
+        """Create one source link in the destination.
+        
+        Returns:
+            True if the link was created, False if it failed, or None if either
+            end of the link was not migrated
+        """
+        try:
+            source_issue = link['source_issue']
+            target_issue = link['target_issue']
+            link_type = link['link_type']
+            
+            if source_issue not in issue_mapping or target_issue not in issue_mapping:
+                return None
+            
+            # Map link type
+            mapped_link_type = link_type_mapping.get(link_type)
+            
+            if mapped_link_type:
+                # Create link in destination
+                self._rate_limiter.acquire()
+                self.dest_api.create_issue_link(
+                    issue_mapping[source_issue],
+                    issue_mapping[target_issue],
+                    mapped_link_type
+                )
+                logger.debug("Created link '%s': %s -> %s", mapped_link_type,
+                             issue_mapping[source_issue], issue_mapping[target_issue])
+                return True
+            
+            # Try fallback link
+            if create_fallback_link(
+                self.dest_api,
+                issue_mapping[source_issue],
+                issue_mapping[target_issue],
+                self.dest_link_types,
+                acquire=self._rate_limiter.acquire
+            ):
+                return True
+            
+            logger.warning("Could not create link for %s -> %s, no suitable link type found",
+                           source_issue, target_issue)
+            return False
+            
+        except Exception as e:
+            logger.error("Failed to create link: %s", e)
+            return False
+    
     def _validate_synchronization(self, sync_id: str, source_project: str, dest_project: str) -> Dict[str, Any]:
         """Validate the synchronization results."""
         logger.info("Validating synchronization")
@@ -766,12 +1143,17 @@ class SyncEngine:
             # Get mapping
             mapping = self.state_manager.get_issue_mapping(sync_id)
             
+            # Compare content hashes for a sample of the created issues
+            sampled, mismatched = self._validate_content_sample(sync_id)
+            
             # Calculate statistics
             result = {
                 'source_issues': source_count,
                 'dest_issues': dest_count,
                 'mapped_issues': len(mapping),
                 'coverage': len(mapping) / source_count if source_count > 0 else 0,
+                'sampled_issues': sampled,
+                'content_mismatches': mismatched,
                 'validation_time': datetime.now().isoformat()
             }
             
@@ -780,6 +1162,7 @@ class SyncEngine:
             logger.info(f"  Destination issues: {result['dest_issues']}")
             logger.info(f"  Mapped issues: {result['mapped_issues']}")
             logger.info(f"  Coverage: {result['coverage']:.2%}")
+            logger.info("  Content mismatches: %d/%d sampled", len(mismatched), sampled)
             
             return result
             
@@ -790,6 +1173,38 @@ class SyncEngine:
                 'validation_time': datetime.now().isoformat()
             }
     
+    def _validate_content_sample(self, sync_id: str) -> Tuple[int, List[str]]:
+        """Re-hash a random sample of destination issues and compare with stored hashes.
+        
+        Issues are not re-checked because their ``updated`` time drifted: the
+        sync itself updates every issue it adds links, comments or attachments
+        to after hashing it, so drift does not point to damaged content.
+        
+        Returns:
+            Tuple of the number of issues sampled and the keys whose content differs
+        """
+        hashes = self.state_manager.get_content_hashes(sync_id)
+        sample_rate = self.config.sync.validation_sample_rate
+        if not hashes or sample_rate <= 0:
+            return 0, []
+        
+        sample_size = min(len(hashes), max(1, math.ceil(len(hashes) * sample_rate)))
+        sample_keys = random.sample(sorted(hashes), sample_size)
+        
+        dest_issues = self.dest_api.get_issues_by_keys(
+            sample_keys, fields=','.join(HASHED_FIELDS)
+        )
+        dest_hashes = {
+            issue['key']: compute_content_hash(issue.get('fields', {}))
+            for issue in dest_issues
+        }
+        
+        mismatched = [key for key in sample_keys if dest_hashes.get(key) != hashes[key]]
+        for key in mismatched:
+            logger.warning("Content mismatch for destination issue %s", key)
+        
+        return sample_size, mismatched
+    
     def _detect_changes_since(self, timestamp: datetime) -> List[Dict[str, Any]]:
         """Detect changes in source project since the given timestamp."""
         logger.info(f"Detecting changes since {timestamp}")
@@ -813,6 +1228,9 @@ class SyncEngine:
         logger.info(f"Processing {len(changes)} incremental changes")
         
         changes_processed = 0
+        # New mappings not yet persisted, written in batches
+        pending: Dict[str, str] = {}
+        self._content_hashes.clear()
         
         try:
             # Get mapping
@@ -836,7 +1254,9 @@ class SyncEngine:
                         
                         # Update mapping
                         mapping[issue_key] = result['dest_key']
-                        self.state_manager.save_issue_mapping(sync_id, mapping)
+                        pending[issue_key] = result['dest_key']
+                        if len(pending) >= self.config.sync.batch_size:
+                            self._save_pending_state(sync_id, pending)
                     
                     changes_processed += 1
                     
@@ -848,6 +1268,9 @@ class SyncEngine:
         except Exception as e:
             logger.error(f"Failed to process incremental changes: {e}")
             return changes_processed
+        
+        finally:
+            self._save_pending_state(sync_id, pending)
     
     def _resume_issue_processing(self, sync_id: str, checkpoint: Dict[str, Any]) -> SyncResult:
         """Resume issue processing from checkpoint."""
@@ -913,49 +1336,67 @@ class SyncEngine:
                 end_time=datetime.now()
             )
             
-    def _process_single_issue(self, issue: Dict[str, Any], dest_project: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _process_issue_in_order(self, index: int, issue: Dict[str, Any],
+                                dest_project: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Process an issue from the worker pool, keeping its creation slot in order."""
+        try:
+            return self._process_single_issue(issue, dest_project, analysis, sequence=index)
+        finally:
+            # Make sure a failed issue never blocks the issues queued behind it
+            if self._sequencer is not None:
+                self._sequencer.release(index)
+    
+    def _process_single_issue(self, issue: Dict[str, Any], dest_project: str, analysis: Dict[str, Any],
+                              sequence: Optional[int] = None) -> Dict[str, Any]:
         """Process a single issue from source to destination."""
-        logger.info(f"Processing issue {issue['key']}")
+        logger.info("Processing issue %s", issue['key'])
         
         try:
             # Map issue type
             issue_type_id = self.issue_type_mapping.get(
-                issue.get('fields', {}).get('issuetype', {}).get('name', 'Task'),
-                # Default to Task if mapping not found
-                next((t['id'] for t in self.dest_api.get_issue_types_for_project(dest_project) 
-                     if t['name'] == 'Task'), None)
+                issue.get('fields', {}).get('issuetype', {}).get('name', 'Task')
             )
+            if not issue_type_id:
+                # Default to Task if mapping not found; the type list is fetched
+                # once and shared with the destination setup
+                dest_types = self._cached(self.dest_api.get_issue_types_for_project, dest_project)
+                issue_type_id = next((t['id'] for t in dest_types if t['name'] == 'Task'), None)
             
             if not issue_type_id:
                 # Fallback to a known issue type ID for Task
                 issue_type_id = "10036"  # Task ID from our analysis
-                logger.warning(f"Using fallback issue type ID for {issue['key']}: {issue_type_id}")
+                logger.warning("Using fallback issue type ID for %s: %s", issue['key'], issue_type_id)
             
             # Prepare issue data with minimal required fields
-            issue_data = {
-                'fields': {
-                    'project': {'key': dest_project},
-                    'summary': truncate_summary(issue['fields'].get('summary', f"Issue from {issue['key']}")),
-                    'issuetype': {'id': issue_type_id},
-                }
-            }
-            
-            # Add description if available
-            if 'description' in issue['fields']:
-                # Use content handler to format and truncate if needed
-                issue_data['fields']['description'] = merge_descriptions(
-                    issue['key'],
-                    issue['fields']['description']
+            build_payload = self._payload_builders.get(dest_project)
+            if build_payload is None:
+                build_payload = self._payload_builders.setdefault(
+                    dest_project, make_payload_builder(dest_project)
                 )
+            issue_data = build_payload(issue, issue_type_id)
+            
+            # Sanitize the issue data to ensure it meets Jira Cloud API requirements;
+            # the payload was just built here, so it can be sanitized in place
+            issue_data = sanitize_issue_data(issue_data, inplace=True)
+            
+            # Log the issue creation payload for debugging; serializing it is
+            # costly, so skip that entirely when DEBUG is disabled
+            if logger.isEnabledFor(logging.DEBUG):
+                payload = (
+                    _orjson_dumps(issue_data).decode('utf-8') if _orjson_dumps is not None
+                    else json.dumps(issue_data)
+                )
+                logger.debug("Issue creation payload for %s: %s", issue['key'], payload)
             
-            # Sanitize the issue data to ensure it meets Jira Cloud API requirements
-            issue_data = sanitize_issue_data(issue_data)
-            
-            # Log the issue creation payload for debugging
-            logger.info(f"Issue creation payload for {issue['key']}: {json.dumps(issue_data)}")
-            
-            # Create issue in destination
-            result = self.dest_api.create_issue(issue_data)
+            # Create issue in destination, in source order when numbers are preserved
+            creation_turn = (
+                self._sequencer.turn(sequence)
+                if self._sequencer is not None and sequence is not None
+                else nullcontext()
+            )
+            with creation_turn:
+                result = self._with_retry(lambda: self.dest_api.create_issue(issue_data))
+            self._content_hashes[result['key']] = compute_content_hash(issue_data['fields'])
             
             # Process attachments if enabled
             attachments_transferred = 0
@@ -973,13 +1414,7 @@ class SyncEngine:
                     result['key']
                 )
             
-            # Update issue mapping
-            self.state_manager.add_issue_mapping(
-                issue['key'],
-                result['key']
-            )
-            
-            logger.info(f"Created issue {result['key']} from {issue['key']}")
+            logger.info("Created issue %s from %s", result['key'], issue['key'])
             
             return {
                 'source_key': issue['key'],
@@ -989,34 +1424,56 @@ class SyncEngine:
             }
             
         except APIError as e:
-            logger.error(f"Failed to create issue: {e}")
+            logger.error("Failed to create issue: %s", e)
             raise SyncError(f"Failed to process issue {issue['key']}: {e}")
     
     def _transfer_attachments(self, attachments: List[Dict[str, Any]], dest_key: str) -> int:
         """Transfer attachments from source issue to destination issue."""
-        transferred = 0
+        if len(attachments) <= 1:
+            return sum(self._transfer_one_attachment(attachment, dest_key) for attachment in attachments)
         
-        for attachment in attachments:
-            try:
-                # Download attachment
+        # Attachments are independent, so download and upload them in parallel
+        workers = min(self.config.sync.attachment_concurrency, len(attachments))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return sum(executor.map(
+                lambda attachment: self._transfer_one_attachment(attachment, dest_key),
+                attachments
+            ))
+    
+    def _transfer_one_attachment(self, attachment: Dict[str, Any], dest_key: str) -> bool:
+        """Transfer a single attachment, returning whether it succeeded."""
+        try:
+            # Small attachments are simply held in memory
+            if (attachment.get('size') or 0) <= ATTACHMENT_STREAM_THRESHOLD:
+                self._rate_limiter.acquire()
                 content = self.source_api.download_attachment(attachment['id'])
                 
-                # Upload to destination
-                self.dest_api.add_attachment(
-                    dest_key,
-                    attachment['filename'],
-                    content
-                )
+                self._rate_limiter.acquire()
+                self.dest_api.add_attachment(dest_key, attachment['filename'], content)
+                return True
+            
+            # Large ones are streamed through a temporary file so only one
+            # chunk is in memory at a time
+            with tempfile.TemporaryFile() as buffer:
+                self._rate_limiter.acquire()
+                for chunk in self.source_api.download_attachment_stream(attachment['id']):
+                    buffer.write(chunk)
+                buffer.seek(0)
                 
-                transferred += 1
-                
-            except Exception as e:
-                logger.error(f"Failed to transfer attachment {attachment['filename']}: {e}")
-        
-        return transferred
+                self._rate_limiter.acquire()
+                self.dest_api.add_attachment(dest_key, attachment['filename'], buffer)
+            return True
+            
+        except Exception as e:
+            logger.error("Failed to transfer attachment %s: %s", attachment['filename'], e)
+            return False
     
     def _transfer_comments(self, comments: List[Dict[str, Any]], dest_key: str) -> int:
-        """Transfer comments from source issue to destination issue."""
+        """Transfer comments from source issue to destination issue.
+        
+        Comments are posted one at a time: Jira orders them by creation time,
+        so posting them concurrently would scramble the conversation.
+        """
         transferred = 0
         
         for comment in comments:
@@ -1034,11 +1491,12 @@ class SyncEngine:
                 }
                 
                 # Add comment to destination
+                self._rate_limiter.acquire()
                 self.dest_api.add_comment(dest_key, comment_data)
                 
                 transferred += 1
                 
             except Exception as e:
-                logger.error(f"Failed to transfer comment: {e}")
+                logger.error("Failed to transfer comment: %s", e)
         
         return transferred
@@ -12,10 +12,47 @@ from typing import Dict, Any, Optional, List, Union
 logger = logging.getLogger(__name__)
 
 # Jira Cloud API limits
-MAX_DESCRIPTION_LENGTH = 32767  # Characters
-MAX_COMMENT_LENGTH = 32767  # Characters
+MAX_DESCRIPTION_LENGTH = 32767  # UTF-8 bytes
+MAX_COMMENT_LENGTH = 32767  # UTF-8 bytes
 MAX_SUMMARY_LENGTH = 255  # Characters
 
+# Appended to descriptions and comments cut down to the size limit
+_TRUNCATION_NOTICE = "\n\n[Content truncated due to size limits]"
+
+# Paragraph separator: a blank line, or several in a row
+_PARA_RE = re.compile(r'\n\n+')
+
+def _is_adf_document(content: Any) -> bool:
+    """Check whether content is already an Atlassian Document Format document."""
+    return isinstance(content, dict) and content.get('type') == 'doc'
+
+def _truncate_to_byte_limit(text: str, limit: int, kind: str) -> str:
+    """
+    Truncate text so its UTF-8 encoding fits within a byte limit.
+    
+    Args:
+        text: The text to check
+        limit: Maximum size in UTF-8 bytes
+        kind: What the text is, for the warning message
+        
+    Returns:
+        The text itself if it fits, otherwise a truncated copy with a notice
+    """
+    # No character takes more than 4 bytes, so short text cannot exceed the
+    # limit and is not encoded at all
+    if len(text) * 4 <= limit:
+        return text
+    
+    encoded = text.encode('utf-8')
+    if len(encoded) <= limit:
+        return text
+    
+    logger.warning("%s exceeds size limit (%d bytes). Truncating.", kind, len(encoded))
+    # Decode straight from a view of the kept bytes, dropping any character
+    # split by the cut
+    kept = str(memoryview(encoded)[:limit - 100], 'utf-8', 'ignore')
+    return kept + _TRUNCATION_NOTICE
+
 def truncate_summary(summary: str) -> str:
     """
     Truncate summary to fit within Jira Cloud limits.
@@ -52,22 +89,15 @@ def format_description_for_cloud(description: Optional[str]) -> Dict[str, Any]:
         return create_adf_document("No description provided.")
     
     # Check if already in ADF format (JSON object)
-    if isinstance(description, dict) and 'type' in description and description['type'] == 'doc':
+    if _is_adf_document(description):
         return description
     
-    # Convert to string if not already
-    description_str = str(description)
-    
-    # Check length and truncate if needed
-    if len(description_str) > MAX_DESCRIPTION_LENGTH:
-        logger.warning(f"Description exceeds size limit ({len(description_str)} chars). Truncating.")
-        truncated_text = description_str[:MAX_DESCRIPTION_LENGTH - 100]
-        truncated_text += "\n\n[Content truncated due to size limits]"
-        return create_adf_document(truncated_text)
+    # Convert to string if not already, truncating if needed
+    description_str = _truncate_to_byte_limit(str(description), MAX_DESCRIPTION_LENGTH, "Description")
     
     return create_adf_document(description_str)
 
-def format_comment_for_cloud(comment: str) -> Dict[str, Any]:
+def format_comment_for_cloud(comment: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
     """
     Format comment text for Jira Cloud API (Atlassian Document Format).
     Handles content size limits by truncating if necessary.
@@ -81,15 +111,12 @@ def format_comment_for_cloud(comment: str) -> Dict[str, Any]:
     if not comment:
         return create_adf_document("No comment text")
     
-    # Convert to string if not already
-    comment_str = str(comment)
+    # Check if already in ADF format (JSON object)
+    if _is_adf_document(comment):
+        return comment
     
-    # Check length and truncate if needed
-    if len(comment_str) > MAX_COMMENT_LENGTH:
-        logger.warning(f"Comment exceeds size limit ({len(comment_str)} chars). Truncating.")
-        truncated_text = comment_str[:MAX_COMMENT_LENGTH - 100]
-        truncated_text += "\n\n[Content truncated due to size limits]"
-        return create_adf_document(truncated_text)
+    # Convert to string if not already, truncating if needed
+    comment_str = _truncate_to_byte_limit(str(comment), MAX_COMMENT_LENGTH, "Comment")
     
     return create_adf_document(comment_str)
 
@@ -103,35 +130,18 @@ def create_adf_document(text: str) -> Dict[str, Any]:
     Returns:
         ADF document structure
     """
-    # Split text into paragraphs
-    paragraphs = text.split('\n\n')
-    if not paragraphs:
-        paragraphs = [""]
-    
-    # Create content array with paragraphs
-    content = []
-    for para in paragraphs:
-        if not para.strip():
-            continue
-            
-        # Handle line breaks within paragraphs
-        lines = para.split('\n')
-        if len(lines) > 1:
-            para_content = []
-            for i, line in enumerate(lines):
-                para_content.append({"type": "text", "text": line})
-                # Add line break between lines, but not after the last line
-                if i < len(lines) - 1:
-                    para_content.append({"type": "hardBreak"})
-            content.append({
-                "type": "paragraph",
-                "content": para_content
-            })
-        else:
-            content.append({
-                "type": "paragraph",
-                "content": [{"type": "text", "text": para}]
-            })
+    # Create content array with paragraphs, skipping blank ones
+    content = [
+        {
+            "type": "paragraph",
+            "content": (
+                _multiline_paragraph_content(para) if '\n' in para
+                else [{"type": "text", "text": para}]
+            )
+        }
+        for para in _PARA_RE.split(text)
+        if para.strip()
+    ]
     
     # Create ADF document
     return {
@@ -140,6 +150,24 @@ def create_adf_document(text: str) -> Dict[str, Any]:
         "content": content
     }
 
+def _multiline_paragraph_content(para: str) -> List[Dict[str, Any]]:
+    """
+    Build the inline content of an ADF paragraph spanning several lines.
+    
+    Args:
+        para: Paragraph text containing at least one newline
+        
+    Returns:
+        Text nodes for each line, separated by hard breaks
+    """
+    lines = para.split('\n')
+    para_content = [{"type": "text", "text": lines[0]}]
+    for line in lines[1:]:
+        # Add line break between lines, but not after the last line
+        para_content.append({"type": "hardBreak"})
+        para_content.append({"type": "text", "text": line})
+    return para_content
+
 def merge_descriptions(original_key: str, description: Optional[str]) -> Dict[str, Any]:
     """
     Merge original issue key reference with description content.
@@ -172,18 +200,20 @@ def merge_descriptions(original_key: str, description: Optional[str]) -> Dict[st
         "content": merged_content
     }
 
-def sanitize_issue_data(issue_data: Dict[str, Any]) -> Dict[str, Any]:
+def sanitize_issue_data(issue_data: Dict[str, Any], inplace: bool = False) -> Dict[str, Any]:
     """
     Sanitize issue data to ensure it meets Jira Cloud API requirements.
     
     Args:
         issue_data: Original issue data
+        inplace: Modify ``issue_data`` itself instead of a shallow copy. Only
+            pass True when the caller owns the dict and nothing else holds it.
         
     Returns:
         Sanitized issue data
     """
-    # Create a copy to avoid modifying the original
-    sanitized = issue_data.copy()
+    # Create a copy to avoid modifying the original, unless the caller owns it
+    sanitized = issue_data if inplace else issue_data.copy()
     
     # Ensure fields exist
     if 'fields' not in sanitized:
@@ -193,9 +223,10 @@ def sanitize_issue_data(issue_data: Dict[str, Any]) -> Dict[str, Any]:
     if 'summary' in sanitized['fields']:
         sanitized['fields']['summary'] = truncate_summary(sanitized['fields']['summary'])
     
-    # Sanitize description
+    # Sanitize description; ADF documents (e.g. from merge_descriptions) are
+    # already formatted and are not rebuilt
     if 'description' in sanitized['fields']:
-        if not isinstance(sanitized['fields']['description'], dict):
+        if not _is_adf_document(sanitized['fields']['description']):
             sanitized['fields']['description'] = format_description_for_cloud(
                 sanitized['fields']['description']
             )
@@ -6,7 +6,7 @@ Jira instances, handling missing link types, and creating fallback relationships
 """
 
 import logging
-from typing import Dict, Any, Optional, List, Set
+from typing import Callable, Dict, Any, Optional, List, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +30,28 @@ STANDARD_LINK_TYPES = {
     "precedes": ["precedes", "predecessor of"]
 }
 
+
+def _build_alias_candidates() -> Dict[str, Tuple[str, ...]]:
+    """Index every standard or alternative name by the names to try for it, in table order."""
+    candidates: Dict[str, Tuple[str, ...]] = {}
+    for standard_type, alternatives in STANDARD_LINK_TYPES.items():
+        for alias in (standard_type, *alternatives):
+            candidates[alias] = candidates.get(alias, ()) + (standard_type, *alternatives)
+    return candidates
+
+
+# Reverse index of STANDARD_LINK_TYPES, built once at import
+_ALIAS_CANDIDATES = _build_alias_candidates()
+
+
+def _find_standard_alternative(link_type_lower: str, available: Any) -> Optional[str]:
+    """Find the first standard name or alternative for a link type that is available."""
+    for candidate in _ALIAS_CANDIDATES.get(link_type_lower, ()):
+        if candidate in available:
+            return candidate
+    return None
+
+
 class LinkTypeMapper:
     """
     Maps link types between source and destination Jira instances,
@@ -58,6 +80,9 @@ class LinkTypeMapper:
                 self.dest_link_type_map[inward] = link_type
             if outward and outward != name and outward != inward:
                 self.dest_link_type_map[outward] = link_type
+        
+        # The fallback only depends on the destination types, so pick it once
+        self._fallback = self._choose_fallback_link_type()
     
     def map_link_type(self, source_link_type: str) -> Optional[str]:
         """
@@ -75,26 +100,15 @@ class LinkTypeMapper:
         
         source_link_type_lower = source_link_type.lower()
         
-        # Direct match
+        # Direct match, otherwise try to find a standard alternative
         if source_link_type_lower in self.dest_link_type_map:
-            self.link_type_map[source_link_type] = source_link_type
-            return source_link_type
+            mapped = source_link_type
+        else:
+            mapped = _find_standard_alternative(source_link_type_lower, self.dest_link_type_map)
         
-        # Try to find a standard alternative
-        for standard_type, alternatives in STANDARD_LINK_TYPES.items():
-            if source_link_type_lower == standard_type or source_link_type_lower in alternatives:
-                if standard_type in self.dest_link_type_map:
-                    self.link_type_map[source_link_type] = standard_type
-                    return standard_type
-                else:
-                    # Try alternatives of the standard type
-                    for alt in alternatives:
-                        if alt in self.dest_link_type_map:
-                            self.link_type_map[source_link_type] = alt
-                            return alt
-        
-        # No mapping found
-        return None
+        # Remember misses too, so unmappable types are only resolved once
+        self.link_type_map[source_link_type] = mapped
+        return mapped
     
     def get_fallback_link_type(self) -> Optional[str]:
         """
@@ -103,6 +117,10 @@ class LinkTypeMapper:
         Returns:
             Fallback link type name or None if no fallback available
         """
+        return self._fallback
+    
+    def _choose_fallback_link_type(self) -> Optional[str]:
+        """Choose the fallback link type from the destination link types."""
         # Try to use "relates to" as fallback
         if "relates to" in self.dest_link_type_map:
             return "relates to"
@@ -173,22 +191,10 @@ def create_link_type_mapping(source_types: Set[str], dest_types: Dict[str, str])
             continue
         
         # Try to find a standard alternative
-        mapped = False
-        for standard_type, alternatives in STANDARD_LINK_TYPES.items():
-            if source_type_lower == standard_type or source_type_lower in alternatives:
-                if standard_type in dest_types_lower:
-                    mapping[source_type] = standard_type
-                    mapped = True
-                    break
-                else:
-                    # Try alternatives of the standard type
-                    for alt in alternatives:
-                        if alt in dest_types_lower:
-                            mapping[source_type] = alt
-                            mapped = True
-                            break
-                    if mapped:
-                        break
+        alternative = _find_standard_alternative(source_type_lower, dest_types_lower)
+        mapped = alternative is not None
+        if mapped:
+            mapping[source_type] = alternative
         
         # If no mapping found, use a default "relates to" type if available
         if not mapped:
@@ -224,19 +230,12 @@ def get_link_type_id(link_type: str, available_types: Dict[str, str]) -> Optiona
         return available_types[link_type_lower]
     
     # Try standard alternatives
-    for standard_type, alternatives in STANDARD_LINK_TYPES.items():
-        if link_type_lower == standard_type or link_type_lower in alternatives:
-            if standard_type in available_types:
-                return available_types[standard_type]
-            for alt in alternatives:
-                if alt in available_types:
-                    return available_types[alt]
-    
-    # No match found
-    return None
+    alternative = _find_standard_alternative(link_type_lower, available_types)
+    return available_types[alternative] if alternative is not None else None
 
 def create_fallback_link(api, source_issue: str, target_issue: str, 
-                       available_types: Dict[str, str]) -> bool:
+                       available_types: Dict[str, str],
+                       acquire: Optional[Callable[[], None]] = None) -> bool:
     """
     Create a fallback link when the original link type is not available.
     
@@ -245,6 +244,7 @@ def create_fallback_link(api, source_issue: str, target_issue: str,
         source_issue: Source issue key
         target_issue: Target issue key
         available_types: Dictionary of available link type names to IDs
+        acquire: Optional rate limiter hook, called before each API request
         
     Returns:
         True if link was created, False otherwise
@@ -252,6 +252,8 @@ def create_fallback_link(api, source_issue: str, target_issue: str,
     # Try to use "relates to" as fallback
     if "relates to" in available_types:
         try:
+            if acquire is not None:
+                acquire()
             api.create_issue_link(source_issue, target_issue, "relates to")
             logger.info(f"Created fallback 'relates to' link: {source_issue} -> {target_issue}")
             return True
@@ -262,6 +264,8 @@ def create_fallback_link(api, source_issue: str, target_issue: str,
     if available_types:
         fallback_type = next(iter(available_types.keys()))
         try:
+            if acquire is not None:
+                acquire()
             api.create_issue_link(source_issue, target_issue, fallback_type)
             logger.info(f"Created fallback '{fallback_type}' link: {source_issue} -> {target_issue}")
             return True
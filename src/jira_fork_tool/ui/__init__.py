@@ -6,16 +6,60 @@ synchronization operations and managing configurations.
 """
 
 import logging
-from flask import Flask, render_template, jsonify, request
+import os
+from flask import Flask, Response, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from typing import Dict, Any
 
 from ..config import Config
 from ..utils import StateManager
 
+# orjson is an optional, faster encoder for the dashboard's JSON responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# waitress is an optional production WSGI server for the dashboard
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
+
 
 logger = logging.getLogger(__name__)
 
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson.
+    
+    Output matches Flask's provider except that it is always compact apart
+    from the indent, and non-ASCII text is written as UTF-8, not escaped.
+    """
+    
+    def dumps_bytes(self, obj: Any, **kwargs: Any) -> bytes:
+        """Serialize data as UTF-8 JSON, honouring ``sort_keys`` and ``indent``.
+        
+        Dates go through Flask's ``default`` hook, so they keep its HTTP
+        date format instead of orjson's ISO 8601.
+        """
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            # orjson only supports two-space indentation
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option)
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON."""
+        return self.dumps_bytes(obj, **kwargs).decode('utf-8')
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize JSON data."""
+        return orjson.loads(s)
+
+
 class Dashboard:
     """Web dashboard for the Jira Fork Tool."""
     
@@ -24,6 +68,8 @@ class Dashboard:
         self.config = config
         self.state_manager = StateManager(config.database)
         self.app = Flask(__name__)
+        if orjson is not None:
+            self.app.json = OrjsonProvider(self.app)
         self._setup_routes()
     
     def _setup_routes(self) -> None:
@@ -61,9 +107,13 @@ class Dashboard:
                 if not sync_details:
                     return jsonify({'error': 'Sync not found'}), 404
                 
+                if orjson is not None:
+                    # Send orjson's bytes as-is, skipping jsonify's str round trip
+                    return Response(self.app.json.dumps_bytes(sync_details),
+                                    mimetype='application/json')
                 return jsonify(sync_details)
             except Exception as e:
-                logger.exception(f"Error getting sync details for {sync_id}")
+                logger.exception("Error getting sync details for %s", sync_id)
                 return jsonify({'error': str(e)}), 500
     
     def _get_recent_syncs(self) -> list:
@@ -80,6 +130,14 @@ class Dashboard:
     
     def run(self, host: str = 'localhost', port: int = 8080, debug: bool = False) -> None:
         """Run the dashboard server."""
-        logger.info(f"Starting dashboard on {host}:{port}")
-        self.app.run(host=host, port=port, debug=debug)
+        logger.info("Starting dashboard on %s:%s", host, port)
+        if serve is not None and not debug:
+            serve(self.app, host=host, port=port, threads=max(4, os.cpu_count() or 1))
+        else:
+            # Werkzeug's development server, also used for debugging/reloading
+            self.app.run(host=host, port=port, debug=debug)
+    
+    def close(self) -> None:
+        """Close the state database."""
+        self.state_manager.close()
 
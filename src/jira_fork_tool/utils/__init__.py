@@ -5,17 +5,149 @@ This module provides common utilities including logging setup,
 state management, progress tracking, and validation functions.
 """
 
+import atexit
+import hashlib
+import importlib.util
+import itertools
 import logging
 import logging.handlers
 import sqlite3
 import json
+import os
+import queue
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import ContextManager, Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+# orjson is an optional, faster serializer for the state database's JSON columns
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+
+def _json_dumps(obj: Any, default=None) -> str:
+    """Serialize a JSON column value, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default,
+                            option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, default=default)
+
+
+def _json_loads(data: str) -> Any:
+    """Parse a JSON column value, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Applied to every StateManager connection. With WAL, NORMAL durability
+# cannot corrupt the database; an OS crash or power loss can only drop the
+# most recent commits, which is acceptable for checkpoint data.
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+    PRAGMA wal_autocheckpoint=1000;
+"""
+
+# SQL for StateManager, parsed once per connection by its statement cache
+_SQL_CREATE_SESSION = """
+    INSERT INTO sync_sessions
+    (sync_id, source_project, dest_project, sync_type)
+    VALUES (?, ?, ?, ?)
+"""
+_SQL_COMPLETE_SESSION = """
+    UPDATE sync_sessions
+    SET status = 'completed', end_time = CURRENT_TIMESTAMP,
+        metadata = ?
+    WHERE sync_id = ?
+"""
+_SQL_FAIL_SESSION = """
+    UPDATE sync_sessions
+    SET status = 'failed', end_time = CURRENT_TIMESTAMP,
+        error_message = ?
+    WHERE sync_id = ?
+"""
+_SQL_GET_SESSION = """
+    SELECT * FROM sync_sessions WHERE sync_id = ?
+"""
+_SQL_SESSIONS_BY_STATUS = """
+    SELECT * FROM sync_sessions
+    WHERE status = ?
+    ORDER BY start_time DESC
+"""
+_SQL_ALL_SESSIONS = """
+    SELECT * FROM sync_sessions
+    ORDER BY start_time DESC
+"""
+_SQL_LAST_SUCCESS = """
+    SELECT * FROM sync_sessions
+    WHERE status = 'completed'
+    ORDER BY end_time DESC
+    LIMIT 1
+"""
+_SQL_INSERT_CHECKPOINT = """
+    INSERT INTO checkpoints
+    (sync_id, phase, progress, total, data)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_LAST_CHECKPOINT = """
+    SELECT * FROM checkpoints
+    WHERE sync_id = ?
+    ORDER BY timestamp DESC, id DESC
+    LIMIT 1
+"""
+_SQL_ACTIVE_SESSION = """
+    SELECT sync_id FROM sync_sessions
+    WHERE status = 'running'
+    ORDER BY start_time DESC
+    LIMIT 1
+"""
+_SQL_UPSERT_MAPPING = """
+    INSERT OR REPLACE INTO issue_mappings
+    (sync_id, source_key, dest_key)
+    VALUES (?, ?, ?)
+"""
+_SQL_GET_MAPPINGS = """
+    SELECT source_key, dest_key FROM issue_mappings
+    WHERE sync_id = ?
+"""
+_SQL_ALL_MAPPINGS = """
+    SELECT source_key, dest_key FROM issue_mappings
+    ORDER BY timestamp DESC
+"""
+_SQL_UPSERT_HASH = """
+    INSERT OR REPLACE INTO issue_hashes
+    (sync_id, dest_key, content_hash)
+    VALUES (?, ?, ?)
+"""
+_SQL_GET_HASHES = """
+    SELECT dest_key, content_hash FROM issue_hashes
+    WHERE sync_id = ?
+"""
+
+# Handler that queues records on the root logger, the background thread that
+# writes them to the real handlers, and those handlers
+_log_handler: Optional[logging.handlers.QueueHandler] = None
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_handlers: List[logging.Handler] = []
 
 
 def setup_logging(level: int = 0, log_file: Optional[Path] = None) -> None:
-    """Set up logging configuration."""
+    """Set up logging configuration.
+    
+    The console and file handlers run on a background QueueListener, so
+    logging calls only enqueue the record instead of writing to disk.
+    """
+    global _log_handler, _log_listener, _log_handlers
     # Map verbosity level to logging level
     log_levels = {
         0: logging.WARNING,
@@ -39,7 +171,7 @@ def setup_logging(level: int = 0, log_file: Optional[Path] = None) -> None:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
     
     # File handler
     if log_file:
@@ -51,21 +183,53 @@ def setup_logging(level: int = 0, log_file: Optional[Path] = None) -> None:
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    if _log_handlers:
+        # Replace the previous setup instead of stacking handlers
+        stop_logging()
+        for handler in _log_handlers:
+            root_logger.removeHandler(handler)
+            handler.close()
+    else:
+        atexit.register(stop_logging)
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_handler = logging.handlers.QueueHandler(log_queue)
+    _log_handlers = handlers
+    root_logger.addHandler(_log_handler)
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _log_listener.start()
+
+
+def stop_logging() -> None:
+    """Write out any queued log records and stop the logging listener.
+    
+    The console and file handlers are put back on the root logger, so
+    records logged afterwards are still written, just synchronously.
+    """
+    global _log_handler, _log_listener
+    if _log_listener is None:
+        return
+    root_logger = logging.getLogger()
+    root_logger.removeHandler(_log_handler)
+    _log_listener.stop()
+    for handler in _log_handlers:
+        root_logger.addHandler(handler)
+    _log_handler = _log_listener = None
 
 
 def validate_environment() -> List[str]:
     """Validate the environment and return any issues found."""
     issues = []
     
-    try:
-        import requests
-    except ImportError:
+    # find_spec only locates the modules, without importing them
+    if importlib.util.find_spec("requests") is None:
         issues.append("requests library not installed")
     
-    try:
-        import yaml
-    except ImportError:
+    if importlib.util.find_spec("yaml") is None:
         issues.append("PyYAML library not installed")
     
     # Add more validation as needed
@@ -73,19 +237,246 @@ def validate_environment() -> List[str]:
     return issues
 
 
+class TokenBucket:
+    """Thread-safe, adaptive token bucket limiting the rate of operations.
+    
+    Tokens refill continuously at ``rate`` up to ``burst``; each ``acquire()``
+    consumes one token, blocking until one is available. When the server
+    signals rate limiting, ``backoff()`` halves the rate for a cool-down
+    period, after which it recovers additively towards ``rate_per_sec``.
+    """
+    
+    def __init__(self, rate_per_sec: float, burst: int = 1, min_rate: Optional[float] = None):
+        """Initialize the token bucket."""
+        self.max_rate = rate_per_sec
+        self.min_rate = min_rate if min_rate is not None else rate_per_sec / 16
+        self.rate = rate_per_sec
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._cooldown_until = 0.0
+        self._condition = threading.Condition()
+    
+    def acquire(self) -> None:
+        """Take one token, waiting for the bucket to refill if it is empty."""
+        with self._condition:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                self._condition.wait((1 - self._tokens) / self.rate)
+    
+    def backoff(self, cooldown: float) -> None:
+        """Halve the rate and hold it there for ``cooldown`` seconds."""
+        with self._condition:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._cooldown_until = time.monotonic() + cooldown
+            logger.warning("Rate limited by server, reducing rate to %.2f/s", self.rate)
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill and recover the rate."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+        
+        # Additive increase: regain the full rate over ~10s once cooled down
+        if self.rate < self.max_rate and now >= self._cooldown_until:
+            self.rate = min(self.max_rate, self.rate + elapsed * self.max_rate / 10)
+
+
+class AnalysisCache:
+    """File-based cache for project analysis results."""
+    
+    SCHEMA_VERSION = 1
+    
+    def __init__(self, cache_dir: str):
+        """Initialize the analysis cache."""
+        self.cache_dir = Path(cache_dir).expanduser()
+    
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load a cached analysis, or None if missing, unreadable or stale."""
+        try:
+            with open(self._path(key), 'r') as f:
+                blob = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if blob.get('schema_version') != self.SCHEMA_VERSION:
+            return None
+        return blob.get('data')
+    
+    def save(self, key: str, data: Dict[str, Any]) -> None:
+        """Atomically write an analysis to the cache."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({'schema_version': self.SCHEMA_VERSION, 'data': data},
+                              f, default=str)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning("Failed to write analysis cache: %s", e)
+    
+    def _path(self, key: str) -> Path:
+        """Get the cache file path for a key."""
+        return self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+
+class _SessionUpdate:
+    """A session state change for the checkpoint writer to commit.
+    
+    The writer executes it in the same transaction as the checkpoints queued
+    before it, and records any database error for the waiting caller.
+    """
+    
+    __slots__ = ('sql', 'params', 'error')
+    
+    def __init__(self, sql: str, params: tuple):
+        self.sql = sql
+        self.params = params
+        self.error: Optional[sqlite3.Error] = None
+
+
+# Queued by StateManager.close() to make the checkpoint writer exit
+_STOP_WRITER = object()
+
+
+class _ReadPool:
+    """Fixed-size pool of read-only SQLite connections.
+    
+    With WAL journaling, readers on these connections run in parallel with
+    each other and with the single writer connection.
+    """
+    
+    def __init__(self, db_path: str, size: int):
+        """Open ``size`` read-only connections to the database."""
+        uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+        self._connections: "queue.Queue[Optional[sqlite3.Connection]]" = queue.Queue()
+        for _ in range(size):
+            conn = sqlite3.connect(uri, uri=True, isolation_level=None,
+                                   check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.executescript(_CONNECTION_PRAGMAS)
+            self._connections.put(conn)
+        self._closed = False
+        self._close_lock = threading.Lock()
+    
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Connection]:
+        """Check out a connection, waiting for one if all are in use."""
+        conn = self._connections.get()
+        if conn is None:
+            # Closed: pass the marker on to the next waiting reader
+            self._connections.put(None)
+            raise sqlite3.ProgrammingError("Cannot read from a closed connection pool")
+        try:
+            yield conn
+        finally:
+            # A connection checked out when the pool was closed is closed on return
+            with self._close_lock:
+                if self._closed:
+                    conn.close()
+                else:
+                    self._connections.put(conn)
+    
+    def close(self) -> None:
+        """Close every pooled connection; checked-out ones close when returned."""
+        with self._close_lock:
+            self._closed = True
+            while True:
+                try:
+                    conn = self._connections.get_nowait()
+                except queue.Empty:
+                    break
+                if conn is not None:
+                    conn.close()
+            self._connections.put(None)
+
+
 class StateManager:
     """Manages persistent state for synchronization operations."""
     
+    # Background checkpoint writer: flush after this many entries or seconds
+    CHECKPOINT_BATCH_SIZE = 50
+    CHECKPOINT_FLUSH_INTERVAL = 1.0
+    # Issue mappings written per transaction by save_issue_mapping
+    ISSUE_MAPPING_BATCH_SIZE = 1000
+    
     def __init__(self, db_config):
         """Initialize the state manager."""
         self.db_path = db_config.path
+        self._checkpoint_queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._checkpoint_writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._closed = False
         self._init_database()
+        
+        # One long-lived connection for writes, shared by all threads one at
+        # a time, and a pool of read-only connections for concurrent reads
+        self._conn = self._connect()
+        self._lock = threading.RLock()
+        self._read_pool = _ReadPool(self.db_path, db_config.read_pool_size)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a database connection tuned for many small writes.
+        
+        The connection is in autocommit mode; writers open their transaction
+        explicitly, so sqlite3 does not inspect each statement to decide
+        whether to begin one implicitly.
+        """
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
+    
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Use the shared connection inside a transaction, committed on success."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            # Commits the explicit transaction on success, rolls back on error
+            with self._conn:
+                yield self._conn
+    
+    def _reading(self) -> ContextManager[sqlite3.Connection]:
+        """Check out a read-only connection from the pool."""
+        return self._read_pool.acquire()
+    
+    def close(self) -> None:
+        """Stop the checkpoint writer and close the database connections.
+        
+        Checkpoints queued before the call are written first. Closing twice
+        is harmless.
+        """
+        with self._writer_lock:
+            if self._closed:
+                return
+            self._closed = True
+            writer, self._checkpoint_writer = self._checkpoint_writer, None
+        if writer is not None:
+            self._checkpoint_queue.put(_STOP_WRITER)
+            writer.join()
+        self._read_pool.close()
+        with self._lock:
+            self._conn.close()
     
     def _init_database(self) -> None:
         """Initialize the SQLite database."""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         
-        with sqlite3.connect(self.db_path) as conn:
+        conn = self._connect()
+        # Journal mode is persistent, so it only needs setting once per file;
+        # it cannot be changed inside a transaction
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("BEGIN")
+        with conn:
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS sync_sessions (
                     sync_id TEXT PRIMARY KEY,
@@ -113,6 +504,16 @@ class StateManager:
                 )
             ''')
             
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS issue_hashes (
+                    sync_id TEXT NOT NULL,
+                    dest_key TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    FOREIGN KEY (sync_id) REFERENCES sync_sessions (sync_id),
+                    PRIMARY KEY (sync_id, dest_key)
+                )
+            ''')
+            
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS issue_mappings (
                     sync_id TEXT NOT NULL,
@@ -123,44 +524,54 @@ class StateManager:
                     PRIMARY KEY (sync_id, source_key)
                 )
             ''')
+            
+            # Let the "latest session/checkpoint" lookups seek instead of scan;
+            # batched checkpoints share a timestamp, so id breaks the tie
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_sessions_status_endtime
+                ON sync_sessions (status, end_time DESC)
+            ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_checkpoints_syncid_ts
+                ON checkpoints (sync_id, timestamp DESC, id DESC)
+            ''')
+        conn.close()
     
     def create_sync_session(self, sync_id: str, source_project: str,
                           dest_project: str, sync_type: str) -> None:
         """Create a new sync session."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT INTO sync_sessions 
-                (sync_id, source_project, dest_project, sync_type)
-                VALUES (?, ?, ?, ?)
-            ''', (sync_id, source_project, dest_project, sync_type))
+        with self._connection() as conn:
+            conn.execute(_SQL_CREATE_SESSION, (sync_id, source_project, dest_project, sync_type))
     
     def complete_sync_session(self, sync_id: str, result) -> None:
         """Mark a sync session as completed."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                UPDATE sync_sessions 
-                SET status = 'completed', end_time = CURRENT_TIMESTAMP,
-                    metadata = ?
-                WHERE sync_id = ?
-            ''', (json.dumps(result.__dict__, default=str), sync_id))
+        self._end_sync_session(_SQL_COMPLETE_SESSION,
+                               (_json_dumps(result.__dict__, default=str), sync_id))
     
     def fail_sync_session(self, sync_id: str, error_message: str) -> None:
         """Mark a sync session as failed."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                UPDATE sync_sessions 
-                SET status = 'failed', end_time = CURRENT_TIMESTAMP,
-                    error_message = ?
-                WHERE sync_id = ?
-            ''', (error_message, sync_id))
+        # Keeps the checkpoints written before the failure, so it can be resumed
+        self._end_sync_session(_SQL_FAIL_SESSION, (error_message, sync_id))
+    
+    def _end_sync_session(self, sql: str, params: tuple) -> None:
+        """Record a session's final state together with its queued checkpoints."""
+        if self._checkpoint_writer is None:
+            with self._connection() as conn:
+                conn.execute(sql, params)
+            return
+        
+        # The writer commits this after, and in one transaction with, the
+        # checkpoints still queued for the session
+        update = _SessionUpdate(sql, params)
+        self._checkpoint_queue.put(update)
+        self._checkpoint_queue.join()
+        if update.error is not None:
+            raise update.error
     
     def get_sync_session(self, sync_id: str) -> Optional[Dict[str, Any]]:
         """Get sync session information."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute('''
-                SELECT * FROM sync_sessions WHERE sync_id = ?
-            ''', (sync_id,))
+        with self._reading() as conn:
+            cursor = conn.execute(_SQL_GET_SESSION, (sync_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
     
@@ -173,62 +584,104 @@ class StateManager:
         Returns:
             List of sync session dictionaries
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
+        with self._reading() as conn:
             if status:
-                cursor = conn.execute('''
-                    SELECT * FROM sync_sessions 
-                    WHERE status = ?
-                    ORDER BY start_time DESC
-                ''', (status,))
+                cursor = conn.execute(_SQL_SESSIONS_BY_STATUS, (status,))
             else:
-                cursor = conn.execute('''
-                    SELECT * FROM sync_sessions 
-                    ORDER BY start_time DESC
-                ''')
+                cursor = conn.execute(_SQL_ALL_SESSIONS)
             
             return [dict(row) for row in cursor.fetchall()]
     
     def get_last_successful_sync(self) -> Optional[Dict[str, Any]]:
         """Get the last successful sync session."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute('''
-                SELECT * FROM sync_sessions 
-                WHERE status = 'completed'
-                ORDER BY end_time DESC
-                LIMIT 1
-            ''')
+        with self._reading() as conn:
+            cursor = conn.execute(_SQL_LAST_SUCCESS)
             row = cursor.fetchone()
             return dict(row) if row else None
     
     def create_checkpoint(self, sync_id: str, phase: str, progress: int,
                          total: int, data: Optional[Dict[str, Any]] = None) -> None:
         """Create a checkpoint for resumable operations."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT INTO checkpoints 
-                (sync_id, phase, progress, total, data)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (sync_id, phase, progress, total, 
-                  json.dumps(data) if data else None))
+        with self._connection() as conn:
+            conn.execute(_SQL_INSERT_CHECKPOINT, (sync_id, phase, progress, total,
+                         _json_dumps(data) if data else None))
+    
+    def checkpoint_async(self, sync_id: str, phase: str, progress: int,
+                         total: int, data: Optional[Dict[str, Any]] = None) -> None:
+        """Queue a checkpoint to be written by the background writer thread.
+        
+        Queued checkpoints are written in batches, so a crash loses at most
+        the last unflushed batch. Call ``flush_checkpoints()`` to wait for them.
+        """
+        self._ensure_checkpoint_writer()
+        self._checkpoint_queue.put((sync_id, phase, progress, total,
+                                    _json_dumps(data) if data else None))
+    
+    def flush_checkpoints(self) -> None:
+        """Block until every queued checkpoint has been written."""
+        if self._checkpoint_writer is None:
+            return
+        # A None entry makes the writer write its current batch right away
+        self._checkpoint_queue.put(None)
+        self._checkpoint_queue.join()
+    
+    def _ensure_checkpoint_writer(self) -> None:
+        """Start the background checkpoint writer if it is not running."""
+        with self._writer_lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Cannot queue a checkpoint on a closed state manager")
+            if self._checkpoint_writer is None:
+                self._checkpoint_writer = threading.Thread(
+                    target=self._checkpoint_writer_loop,
+                    name="checkpoint-writer",
+                    daemon=True
+                )
+                self._checkpoint_writer.start()
+    
+    def _checkpoint_writer_loop(self) -> None:
+        """Drain the checkpoint queue, writing each batch in one transaction."""
+        while True:
+            batch = [self._checkpoint_queue.get()]
+            deadline = time.monotonic() + self.CHECKPOINT_FLUSH_INTERVAL
+            # Checkpoint rows are tuples; a flush marker, session update or
+            # stop marker ends the batch
+            while isinstance(batch[-1], tuple) and len(batch) < self.CHECKPOINT_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._checkpoint_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            rows = [entry for entry in batch if isinstance(entry, tuple)]
+            update = batch[-1] if isinstance(batch[-1], _SessionUpdate) else None
+            try:
+                if rows or update is not None:
+                    with self._connection() as conn:
+                        if rows:
+                            conn.executemany(_SQL_INSERT_CHECKPOINT, rows)
+                        if update is not None:
+                            conn.execute(update.sql, update.params)
+            except sqlite3.Error as e:
+                logger.error("Failed to write %d checkpoints: %s", len(rows), e)
+                if update is not None:
+                    update.error = e
+            finally:
+                for _ in batch:
+                    self._checkpoint_queue.task_done()
+            if batch[-1] is _STOP_WRITER:
+                return
     
     def get_last_checkpoint(self, sync_id: str) -> Optional[Dict[str, Any]]:
         """Get the last checkpoint for a sync session."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute('''
-                SELECT * FROM checkpoints 
-                WHERE sync_id = ?
-                ORDER BY timestamp DESC
-                LIMIT 1
-            ''', (sync_id,))
+        with self._reading() as conn:
+            cursor = conn.execute(_SQL_LAST_CHECKPOINT, (sync_id,))
             row = cursor.fetchone()
             if row:
                 result = dict(row)
                 if result['data']:
-                    result['data'] = json.loads(result['data'])
+                    result['data'] = _json_loads(result['data'])
                 return result
             return None
     
@@ -252,31 +705,21 @@ class StateManager:
         """
         if not sync_id:
             # Get the latest active sync session
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute('''
-                    SELECT sync_id FROM sync_sessions 
-                    WHERE status = 'running'
-                    ORDER BY start_time DESC
-                    LIMIT 1
-                ''')
+            with self._reading() as conn:
+                cursor = conn.execute(_SQL_ACTIVE_SESSION)
                 row = cursor.fetchone()
                 if not row:
-                    logging.error("No active sync session found for issue mapping")
+                    logger.error("No active sync session found for issue mapping")
                     return
                 sync_id = row['sync_id']
         
         # Insert or replace the mapping
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             try:
-                conn.execute('''
-                    INSERT OR REPLACE INTO issue_mappings 
-                    (sync_id, source_key, dest_key)
-                    VALUES (?, ?, ?)
-                ''', (sync_id, source_key, dest_key))
-                logging.info(f"Mapped {source_key} to {dest_key} in sync {sync_id}")
+                conn.execute(_SQL_UPSERT_MAPPING, (sync_id, source_key, dest_key))
+                logger.info("Mapped %s to %s in sync %s", source_key, dest_key, sync_id)
             except sqlite3.Error as e:
-                logging.error(f"Failed to add issue mapping: {e}")
+                logger.error("Failed to add issue mapping: %s", e)
     
     def get_issue_mapping(self, sync_id: str) -> Dict[str, str]:
         """Get all issue mappings for a sync session.
@@ -287,12 +730,8 @@ class StateManager:
         Returns:
             A dictionary mapping source keys to destination keys
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute('''
-                SELECT source_key, dest_key FROM issue_mappings 
-                WHERE sync_id = ?
-            ''', (sync_id,))
+        with self._reading() as conn:
+            cursor = conn.execute(_SQL_GET_MAPPINGS, (sync_id,))
             
             return {row['source_key']: row['dest_key'] for row in cursor.fetchall()}
     
@@ -302,12 +741,8 @@ class StateManager:
         Returns:
             A dictionary mapping source keys to destination keys
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute('''
-                SELECT source_key, dest_key FROM issue_mappings
-                ORDER BY timestamp DESC
-            ''')
+        with self._reading() as conn:
+            cursor = conn.execute(_SQL_ALL_MAPPINGS)
             
             # Use a dictionary to ensure we get the latest mapping for each source key
             mappings = {}
@@ -317,67 +752,159 @@ class StateManager:
             
             return mappings
     
-    def save_issue_mapping(self, sync_id: str, mapping: Dict[str, str]) -> None:
+    def save_issue_mapping(self, sync_id: str,
+                           mapping: Union[Dict[str, str], Iterable[Tuple[str, str]]]) -> None:
         """Save multiple issue mappings at once.
         
+        Mappings are written with executemany, ISSUE_MAPPING_BATCH_SIZE rows
+        per transaction, so callers should accumulate them and save in bulk
+        rather than calling ``add_issue_mapping`` per issue.
+        
         Args:
             sync_id: The sync session ID
-            mapping: Dictionary mapping source keys to destination keys
+            mapping: Dictionary or iterable of (source key, destination key) pairs
         """
-        with sqlite3.connect(self.db_path) as conn:
+        pairs = iter(mapping.items() if isinstance(mapping, dict) else mapping)
+        saved = 0
+        try:
+            while True:
+                batch = [(sync_id, source_key, dest_key) for source_key, dest_key
+                         in itertools.islice(pairs, self.ISSUE_MAPPING_BATCH_SIZE)]
+                if not batch:
+                    break
+                with self._connection() as conn:
+                    conn.executemany(_SQL_UPSERT_MAPPING, batch)
+                saved += len(batch)
+            
+            logger.info("Saved %d issue mappings for sync %s", saved, sync_id)
+        except sqlite3.Error as e:
+            logger.error("Failed to save issue mappings: %s", e)
+    
+    def save_content_hashes(self, sync_id: str, hashes: Dict[str, str]) -> None:
+        """Save content hashes of created destination issues.
+        
+        Args:
+            sync_id: The sync session ID
+            hashes: Dictionary mapping destination keys to content hashes
+        """
+        with self._connection() as conn:
             try:
-                # Prepare data for bulk insert
-                data = [(sync_id, source_key, dest_key) 
-                        for source_key, dest_key in mapping.items()]
-                
-                # Use executemany for better performance
-                conn.executemany('''
-                    INSERT OR REPLACE INTO issue_mappings 
-                    (sync_id, source_key, dest_key)
-                    VALUES (?, ?, ?)
-                ''', data)
-                
-                logging.info(f"Saved {len(mapping)} issue mappings for sync {sync_id}")
+                conn.executemany(_SQL_UPSERT_HASH,
+                                 [(sync_id, dest_key, content_hash)
+                                  for dest_key, content_hash in hashes.items()])
             except sqlite3.Error as e:
-                logging.error(f"Failed to save issue mappings: {e}")
+                logger.error("Failed to save content hashes: %s", e)
+    
+    def get_content_hashes(self, sync_id: str) -> Dict[str, str]:
+        """Get content hashes of destination issues for a sync session.
+        
+        Args:
+            sync_id: The sync session ID
+            
+        Returns:
+            A dictionary mapping destination keys to content hashes
+        """
+        with self._reading() as conn:
+            cursor = conn.execute(_SQL_GET_HASHES, (sync_id,))
+            
+            return dict(cursor.fetchall())
 
 
 class ProgressTracker:
-    """Tracks and reports progress of synchronization operations."""
+    """Tracks and reports progress of synchronization operations.
+    
+    Progress updates are plain attribute stores so they are cheap enough to
+    call from the issue processing loop.
+    Log output is produced by a background reporter thread that samples the
+    current progress every ``report_interval`` seconds, and logs it when it
+    crosses a whole percent or ``log_interval`` seconds have passed.
+    """
     
-    def __init__(self):
+    def __init__(self, report_interval: float = 0.1, log_interval: float = 0.5):
         """Initialize the progress tracker."""
         self.current_phase = None
         self.phase_progress = 0
         self.phase_total = 0
         self.start_time = None
+        self.report_interval = report_interval
+        self.log_interval = log_interval
+        self._stop_event = threading.Event()
+        self._reporter: Optional[threading.Thread] = None
+        self._last_reported = 0
+        self._last_log_bucket = -1
+        self._last_log_time = 0.0
     
     def start_phase(self, phase_name: str, total_items: int) -> None:
         """Start tracking a new phase."""
+        self._stop_reporter()
+        
         self.current_phase = phase_name
         self.phase_progress = 0
         self.phase_total = total_items
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic_ns()
+        self._last_reported = 0
+        self._last_log_bucket = -1
+        self._last_log_time = 0.0
+        
+        logger.info("Starting phase: %s (%d items)", phase_name, total_items)
         
-        logging.info(f"Starting phase: {phase_name} ({total_items} items)")
+        # Progress lines are INFO records, so skip the reporter when INFO is off
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        self._stop_event.clear()
+        self._reporter = threading.Thread(
+            target=self._report_loop,
+            name=f"progress-{phase_name}",
+            daemon=True
+        )
+        self._reporter.start()
     
     def update_progress(self, completed_items: int) -> None:
         """Update progress within the current phase."""
         self.phase_progress = completed_items
-        
-        if self.phase_total > 0:
-            percentage = (completed_items / self.phase_total) * 100
-            logging.info(f"Progress: {completed_items}/{self.phase_total} "
-                        f"({percentage:.1f}%)")
     
     def complete_phase(self) -> None:
         """Mark the current phase as complete."""
-        if self.current_phase and self.start_time:
-            duration = datetime.now() - self.start_time
-            logging.info(f"Completed phase: {self.current_phase} "
-                        f"in {duration}")
+        self._stop_reporter()
+        
+        if self.current_phase and self.start_time is not None:
+            duration = (time.monotonic_ns() - self.start_time) / 1e9
+            logger.info("Completed phase: %s in %.3fs", self.current_phase, duration)
         
         self.current_phase = None
         self.phase_progress = 0
         self.phase_total = 0
         self.start_time = None
+    
+    def _report_loop(self) -> None:
+        """Periodically report progress until the phase is stopped."""
+        while not self._stop_event.wait(self.report_interval):
+            self._report()
+        self._report(final=True)
+    
+    def _report(self, final: bool = False) -> None:
+        """Log the current progress if it changed enough since the last report."""
+        completed_items = self.phase_progress
+        if completed_items == self._last_reported or self.phase_total <= 0:
+            return
+        
+        bucket = (completed_items * 100) // self.phase_total
+        now = time.monotonic()
+        if (not final and bucket == self._last_log_bucket
+                and now - self._last_log_time < self.log_interval):
+            return
+        
+        self._last_reported = completed_items
+        self._last_log_bucket = bucket
+        self._last_log_time = now
+        percentage = (completed_items / self.phase_total) * 100
+        logger.info("Progress: %d/%d (%.1f%%)",
+                    completed_items, self.phase_total, percentage)
+    
+    def _stop_reporter(self) -> None:
+        """Stop the background reporter thread, if one is running."""
+        if self._reporter is not None:
+            self._stop_event.set()
+            self._reporter.join()
+            self._reporter = None